@@ -42,6 +42,27 @@ _audit_logger_instance: Optional["AuditLogger"] = None
 _audit_lock = threading.Lock()
 
 
+def _chain_hash(previous_hash: str, fields: tuple) -> str:
+    """
+    Compute a record's hash-chain link.
+
+    Args:
+        previous_hash: record_hash of the preceding record ("0" * 64 for genesis)
+        fields: (event_id, event_timestamp, action, resource_type,
+                 resource_id, user_id, outcome)
+
+    Returns:
+        Hex SHA-256 of the pipe-joined fields followed by previous_hash
+    """
+    event_id, event_timestamp, action, resource_type, resource_id, user_id, outcome = fields
+    hash_input = (
+        f"{event_id}|{event_timestamp.isoformat()}|"
+        f"{action}|{resource_type}|{resource_id}|"
+        f"{user_id}|{outcome}|{previous_hash}"
+    )
+    return hashlib.sha256(hash_input.encode()).hexdigest()
+
+
 class AuditLogger:
     """
     Immutable audit logging with hash chain for tamper detection.
@@ -58,6 +79,83 @@ class AuditLogger:
     def _get_session(self) -> Session:
         return self._session_factory()
 
+    def _build_record(
+        self,
+        prev,
+        *,
+        action: str,
+        resource_type: str,
+        resource_id: Optional[str],
+        user_id: Optional[str],
+        user_email: Optional[str],
+        user_role: Optional[str],
+        agency_id: Optional[str],
+        api_key_id: Optional[str],
+        ip_address: Optional[str],
+        user_agent: Optional[str],
+        request_id: Optional[str],
+        session_id: Optional[str],
+        outcome: str,
+        outcome_reason: Optional[str],
+        previous_state: Optional[dict],
+        new_state: Optional[dict],
+        metadata: Optional[dict],
+    ) -> dict:
+        """
+        Build the next audit_log row, linked to the previous record.
+
+        Pure computation (no I/O), so the chain logic can be tested
+        without a database or event loop.
+
+        Args:
+            prev: Latest existing row (sequence_number, record_hash), or None
+            Remaining keyword arguments are the event fields documented on log()
+
+        Returns:
+            Insert parameters for the audit_log row, including event_id,
+            sequence_number, previous_hash and record_hash
+        """
+        if prev:
+            sequence_number = prev.sequence_number + 1
+            previous_hash = prev.record_hash
+        else:
+            sequence_number = 1
+            previous_hash = "0" * 64
+
+        event_timestamp = datetime.utcnow()
+        event_id = str(uuid.uuid4())
+
+        record_hash = _chain_hash(
+            previous_hash,
+            (event_id, event_timestamp, action, resource_type,
+             resource_id, user_id, outcome),
+        )
+
+        return {
+            "event_id": event_id,
+            "event_timestamp": event_timestamp,
+            "user_id": user_id,
+            "user_email": user_email,
+            "user_role": user_role,
+            "agency_id": agency_id,
+            "api_key_id": api_key_id,
+            "action": action,
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "ip_address": ip_address,
+            "user_agent": user_agent[:500] if user_agent else None,
+            "request_id": request_id,
+            "session_id": session_id,
+            "outcome": outcome,
+            "outcome_reason": outcome_reason,
+            "previous_state": json.dumps(previous_state) if previous_state else None,
+            "new_state": json.dumps(new_state) if new_state else None,
+            "sequence_number": sequence_number,
+            "previous_hash": previous_hash,
+            "record_hash": record_hash,
+            "metadata": json.dumps(metadata) if metadata else None,
+        }
+
     async def log(
         self,
         action: str,
@@ -114,22 +212,26 @@ class AuditLogger:
                     )
                 ).fetchone()
 
-                if prev:
-                    sequence_number = prev.sequence_number + 1
-                    previous_hash = prev.record_hash
-                else:
-                    sequence_number = 1
-                    previous_hash = "0" * 64
-
-                event_timestamp = datetime.utcnow()
-                event_id = str(uuid.uuid4())
-
-                hash_input = (
-                    f"{event_id}|{event_timestamp.isoformat()}|"
-                    f"{action}|{resource_type}|{resource_id}|"
-                    f"{user_id}|{outcome}|{previous_hash}"
+                record = self._build_record(
+                    prev,
+                    action=action,
+                    resource_type=resource_type,
+                    resource_id=resource_id,
+                    user_id=user_id,
+                    user_email=user_email,
+                    user_role=user_role,
+                    agency_id=agency_id,
+                    api_key_id=api_key_id,
+                    ip_address=ip_address,
+                    user_agent=user_agent,
+                    request_id=request_id,
+                    session_id=session_id,
+                    outcome=outcome,
+                    outcome_reason=outcome_reason,
+                    previous_state=previous_state,
+                    new_state=new_state,
+                    metadata=metadata,
                 )
-                record_hash = hashlib.sha256(hash_input.encode()).hexdigest()
 
                 db.execute(
                     text("""
@@ -149,44 +251,21 @@ class AuditLogger:
                             :previous_hash, :record_hash, :metadata
                         )
                     """),
-                    {
-                        "event_id": event_id,
-                        "event_timestamp": event_timestamp,
-                        "user_id": user_id,
-                        "user_email": user_email,
-                        "user_role": user_role,
-                        "agency_id": agency_id,
-                        "api_key_id": api_key_id,
-                        "action": action,
-                        "resource_type": resource_type,
-                        "resource_id": resource_id,
-                        "ip_address": ip_address,
-                        "user_agent": user_agent[:500] if user_agent else None,
-                        "request_id": request_id,
-                        "session_id": session_id,
-                        "outcome": outcome,
-                        "outcome_reason": outcome_reason,
-                        "previous_state": json.dumps(previous_state) if previous_state else None,
-                        "new_state": json.dumps(new_state) if new_state else None,
-                        "sequence_number": sequence_number,
-                        "previous_hash": previous_hash,
-                        "record_hash": record_hash,
-                        "metadata": json.dumps(metadata) if metadata else None,
-                    },
+                    record,
                 )
                 db.commit()
 
                 logger.debug(
                     "Audit event logged",
                     extra={
-                        "event_id": event_id,
+                        "event_id": record["event_id"],
                         "action": action,
                         "resource_type": resource_type,
-                        "sequence_number": sequence_number,
+                        "sequence_number": record["sequence_number"],
                     },
                 )
 
-                return event_id
+                return record["event_id"]
 
         except Exception as e:
             db.rollback()
@@ -264,12 +343,12 @@ class AuditLogger:
                         )
                         return False, record.sequence_number
 
-                    hash_input = (
-                        f"{record.event_id}|{record.event_timestamp.isoformat()}|"
-                        f"{record.action}|{record.resource_type}|{record.resource_id}|"
-                        f"{record.user_id}|{record.outcome}|{record.previous_hash}"
+                    expected_hash = _chain_hash(
+                        record.previous_hash,
+                        (record.event_id, record.event_timestamp, record.action,
+                         record.resource_type, record.resource_id, record.user_id,
+                         record.outcome),
                     )
-                    expected_hash = hashlib.sha256(hash_input.encode()).hexdigest()
 
                     if record.record_hash != expected_hash:
                         logger.warning(
@@ -7,11 +7,24 @@ All configuration is managed through environment variables with sensible default
 import os
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Tuple
 
 import torch
 
 
+@lru_cache(maxsize=8)
+def _parse_cutoff_date(date_str: str) -> datetime:
+    """Parse a YYYY-MM-DD cutoff once; it is checked for every scanned file."""
+    year, month, day = date_str.split("-")
+    return datetime(int(year), int(month), int(day))
+
+
+@lru_cache(maxsize=8)
+def _cutoff_timestamp(date_str: str) -> float:
+    return _parse_cutoff_date(date_str).timestamp()
+
+
 @dataclass
 class TranscriptionConfig:
     """Configuration for transcription services."""
@@ -124,8 +137,12 @@ class TranscriptionConfig:
     @property
     def cutoff_datetime(self) -> datetime:
         """Get the cutoff datetime for file filtering."""
-        year, month, day = self.skip_files_before_date.split("-")
-        return datetime(int(year), int(month), int(day))
+        return _parse_cutoff_date(self.skip_files_before_date)
+
+    @property
+    def cutoff_timestamp(self) -> float:
+        """Get the cutoff as a POSIX timestamp, for comparing against st_ctime."""
+        return _cutoff_timestamp(self.skip_files_before_date)
 
     @property
     def max_upload_size_bytes(self) -> int:
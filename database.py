@@ -4,6 +4,7 @@ Database connection and session management.
 Provides SQLAlchemy engine, session factory, and helper functions for database operations.
 """
 
+import json
 import logging
 from contextlib import contextmanager
 from typing import Generator
@@ -15,8 +16,21 @@ from sqlalchemy.pool import QueuePool
 
 from config import config
 
+try:
+    import orjson  # Optional: faster JSON/JSONB column encoding
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+
+def _json_serializer(obj) -> str:
+    """Encode JSON/JSONB column values, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(obj)
+
+
 # Create database engine with connection pooling
 engine = create_engine(
     config.database_url,
@@ -26,6 +40,7 @@ engine = create_engine(
     pool_pre_ping=True,  # Verify connections before use (prevents stale connections)
     pool_recycle=3600,  # Recycle connections after 1 hour
     echo=False,  # Set to True for SQL query logging (debug only)
+    json_serializer=_json_serializer,  # Segment lists can hold thousands of entries
 )
 
 
@@ -3,8 +3,9 @@ Thread-safe model pool with lazy loading and memory management.
 
 Provides a pool of Whisper models that can be shared across workers:
 - Lazy loading: Models loaded on-demand, not upfront
-- LRU eviction: Automatically unload least-used models when memory constrained
+- Frequency-based eviction: Automatically unload least-used models when memory constrained
 - Fallback support: Automatically retry with smaller models on OOM
+- Prefetching: Warm models in the background ahead of predicted demand
 - Thread-safe: Safe for concurrent use in multi-threaded/multi-process environments
 - Statistics: Track hits, misses, evictions, and OOM fallbacks
 
@@ -22,7 +23,9 @@ import gc
 import logging
 import queue
 import threading
+import time
 import weakref
+from collections import Counter
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
@@ -35,6 +38,16 @@ from config import config
 
 logger = logging.getLogger(__name__)
 
+# Backend availability can't change within a process; probe once at import
+_CUDA_AVAILABLE = torch.cuda.is_available()
+_MPS_AVAILABLE = torch.backends.mps.is_available()
+
+# Unloads between full (all-generation) garbage collections
+_FULL_GC_INTERVAL = 8
+
+# Seconds for a model's eviction heat (decayed use count) to halve
+_HEAT_HALF_LIFE_S = 600.0
+
 
 @dataclass
 class ModelInstance:
@@ -49,6 +62,7 @@ class ModelInstance:
     last_used: datetime
     use_count: int = 0
     memory_mb: float = 0.0
+    heat: float = 1.0  # Decayed use count as of last_used; the load counts once
 
     def __post_init__(self):
         """Calculate memory usage after initialization."""
@@ -67,6 +81,39 @@ class ModelInstance:
             logger.warning(f"Could not calculate model memory: {e}")
             return 0.0
 
+    def decayed_heat(self, now: datetime) -> float:
+        """Return the use count decayed by the time since last_used."""
+        idle_s = max(0.0, (now - self.last_used).total_seconds())
+        return self.heat * 0.5 ** (idle_s / _HEAT_HALF_LIFE_S)
+
+    def touch(self, now: datetime):
+        """Record one acquisition at `now`."""
+        self.heat = self.decayed_heat(now) + 1
+        self.last_used = now
+        self.use_count += 1
+
+
+class PoolStats:
+    """
+    Pool efficiency counters.
+
+    Uses __slots__ (dataclass(slots=True) needs Python 3.10) so counter
+    updates on the acquire/release path are plain attribute stores.
+    """
+    __slots__ = ('hits', 'misses', 'evictions', 'oom_fallbacks')
+
+    def __init__(self):
+        self.hits = 0           # Model acquired from pool
+        self.misses = 0         # Model had to be loaded
+        self.evictions = 0      # Models evicted due to memory
+        self.oom_fallbacks = 0  # OOM errors that triggered fallback
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of acquisitions served from the pool."""
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
 
 class ModelPool:
     """
@@ -74,7 +121,7 @@ class ModelPool:
 
     Features:
     - Lazy loading: Models only loaded when first requested
-    - Size-based eviction: Remove LRU models when pool size exceeded
+    - Size-based eviction: Remove least-used models when pool size exceeded
     - Multiple model sizes: Support fallback to smaller models
     - Health checking: Detect and replace corrupted models
     - Statistics: Track pool efficiency
@@ -107,17 +154,25 @@ class ModelPool:
         # Lock for thread-safe operations
         self._lock = threading.RLock()
 
-        # Track all loaded models for LRU eviction
+        # Signalled whenever a model is returned or unloaded, so a miss
+        # that found the pool at capacity can retry
+        self._released = threading.Condition(self._lock)
+
+        # Track all loaded models for eviction
         # Using weakref to allow garbage collection
         self._loaded_models: Dict[int, ModelInstance] = {}
 
+        # In-flight background loads per size (see prefetch)
+        self._loading: Counter = Counter()
+
+        # Per-thread record of the last released model (see acquire)
+        self._affinity = threading.local()
+
+        # Unloads since startup, used to space out full GC passes
+        self._unload_count = 0
+
         # Statistics
-        self._stats = {
-            'hits': 0,          # Model acquired from pool
-            'misses': 0,        # Model had to be loaded
-            'evictions': 0,     # Models evicted due to memory
-            'oom_fallbacks': 0  # OOM errors that triggered fallback
-        }
+        self._stats = PoolStats()
 
         logger.info(
             f"Model pool initialized: default={default_size}, "
@@ -129,7 +184,9 @@ class ModelPool:
         Acquire a model from the pool.
 
         Blocks if all models are in use (with timeout).
-        If pool is empty, loads a new model.
+        If pool is empty, loads a new model, evicting an idle one first
+        when the pool is at max_pool_size. If every loaded model is checked
+        out, waits for one to be released instead of exceeding the cap.
 
         Args:
             model_size: Desired model size (tiny, base, small, medium, large)
@@ -144,43 +201,126 @@ class ModelPool:
         """
         if model_size is None:
             model_size = self.default_size
+        deadline = time.monotonic() + timeout
 
         with self._lock:
             # Initialize queue for this model size if needed
             if model_size not in self._models:
                 self._models[model_size] = queue.Queue(maxsize=self.pool_size)
 
-        # Try to get existing model from pool
+        # Try to get existing model from pool, preferring the one this
+        # thread used last (its weights and GPU workspace are still warm)
         try:
-            instance = self._models[model_size].get(timeout=timeout)
-            instance.use_count += 1
-            instance.last_used = datetime.now()
+            instance = self._take_last_released(model_size)
+            if instance is None:
+                instance = self._models[model_size].get(timeout=timeout)
+        except queue.Empty:
+            instance = self._reserve_load(model_size, deadline)
+            if instance is None:
+                return self._load_on_miss(model_size)
 
-            with self._lock:
-                self._stats['hits'] += 1
+        return self._checkout(instance)
 
-            logger.debug(
-                f"Acquired existing {model_size} model from pool "
-                f"(use_count={instance.use_count})"
-            )
-            return instance
+    def _checkout(self, instance: ModelInstance) -> ModelInstance:
+        """
+        Record a pool hit for an instance taken from its queue.
 
-        except queue.Empty:
-            # No available model - need to load new one
-            with self._lock:
-                self._stats['misses'] += 1
+        Args:
+            instance: ModelInstance just taken from the pool
+
+        Returns:
+            The same instance, with its usage updated
+        """
+        instance.touch(datetime.now())
+
+        with self._lock:
+            self._stats.hits += 1
+
+        logger.debug(
+            f"Acquired existing {instance.model_size} model from pool "
+            f"(use_count={instance.use_count})"
+        )
+        return instance
+
+    def _reserve_load(self, model_size: str,
+                      deadline: float) -> Optional[ModelInstance]:
+        """
+        Wait until a new model may be loaded without exceeding the cap.
+
+        If a model of this size is already loading (e.g. a prefetch), waits
+        for it rather than loading a duplicate. Evicts an idle model if the
+        pool is full; if none is idle, waits for a release. A model of the
+        wanted size released meanwhile is returned instead. On None the
+        caller owns a _loading slot and must load via _load_on_miss.
+
+        Args:
+            model_size: Desired model size
+            deadline: time.monotonic() value after which to give up
+
+        Returns:
+            An idle ModelInstance of model_size, or None if the caller
+            should load a new one
+
+        Raises:
+            queue.Empty: If the deadline passes with the pool still full
+        """
+        evicted = False
+        with self._released:
+            while True:
+                try:
+                    return self._models[model_size].get_nowait()
+                except queue.Empty:
+                    pass
+
+                if not self._loading[model_size]:
+                    loaded = self._total_models_loaded() + sum(self._loading.values())
+                    if loaded < self.max_pool_size:
+                        self._loading[model_size] += 1
+                        break
+                    if self._evict_model():
+                        evicted = True
+                        continue
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise queue.Empty(
+                        f"No {model_size} model available, and the pool "
+                        f"is loading one or is full with every model in use"
+                    )
+                self._released.wait(remaining)
+
+        if evicted:
+            # Return the evicted weights to the device before loading
+            self._clear_gpu_cache()
+        return None
+
+    def _load_on_miss(self, model_size: str) -> ModelInstance:
+        """
+        Load a new model for a caller that found the pool empty.
+
+        The caller must hold the _loading slot taken by _reserve_load.
+
+        Args:
+            model_size: Model size to load
 
-            # Check if we need to evict before loading
-            if self._total_models_loaded() >= self.max_pool_size:
-                self._evict_lru_model()
+        Returns:
+            Newly loaded ModelInstance, checked out to the caller
+        """
+        with self._lock:
+            self._stats.misses += 1
 
-            # Load new model
+        try:
             instance = self._load_model(model_size)
-            logger.info(
-                f"Loaded new {model_size} model into pool "
-                f"(total models: {self._total_models_loaded()})"
-            )
-            return instance
+        finally:
+            with self._released:
+                self._loading[model_size] -= 1
+                self._released.notify_all()
+
+        logger.info(
+            f"Loaded new {model_size} model into pool "
+            f"(total models: {self._total_models_loaded()})"
+        )
+        return instance
 
     def release(self, instance: ModelInstance):
         """
@@ -193,6 +333,7 @@ class ModelPool:
             try:
                 # Try to put model back in queue
                 self._models[instance.model_size].put_nowait(instance)
+                self._affinity.last_released = instance
                 logger.debug(f"Released {instance.model_size} model back to pool")
             except queue.Full:
                 # Pool is full - unload this model
@@ -201,6 +342,86 @@ class ModelPool:
                     f"(use_count was {instance.use_count})"
                 )
                 self._unload_model(instance)
+            self._released.notify_all()
+
+    def _take_last_released(self, model_size: str) -> Optional[ModelInstance]:
+        """
+        Take the calling thread's last released model if it is still idle.
+
+        Args:
+            model_size: Desired model size
+
+        Returns:
+            The thread's previous ModelInstance, or None if it is a different
+            size or another thread has taken it since
+        """
+        last = getattr(self._affinity, 'last_released', None)
+        if last is None or last.model_size != model_size:
+            return None
+
+        model_queue = self._models[model_size]
+        with model_queue.mutex:
+            for idx, idle in enumerate(model_queue.queue):
+                if idle is last:
+                    del model_queue.queue[idx]
+                    model_queue.not_full.notify()
+                    return last
+        return None
+
+    def prefetch(self, model_size: str = None) -> None:
+        """
+        Load a model into the pool in the background.
+
+        Overlaps the (slow) model load with whatever the caller is doing,
+        so a later acquire() for this size is a hit instead of a miss.
+        Does nothing if the pool already holds or is loading enough models
+        of this size, or if loading one would require an eviction.
+
+        Args:
+            model_size: Model size to warm (None = use default)
+        """
+        if model_size is None:
+            model_size = self.default_size
+
+        with self._lock:
+            if model_size not in self._models:
+                self._models[model_size] = queue.Queue(maxsize=self.pool_size)
+
+            in_flight = self._loading[model_size]
+            if self._models[model_size].qsize() + in_flight >= self.pool_size:
+                return
+
+            # Never evict a model that may be in use for a speculative load
+            if self._total_models_loaded() + sum(self._loading.values()) >= self.max_pool_size:
+                logger.debug(f"Skipping prefetch of {model_size}: pool at capacity")
+                return
+
+            self._loading[model_size] += 1
+
+        logger.info(f"Prefetching {model_size} model in background")
+        threading.Thread(
+            target=self._prefetch_worker,
+            args=(model_size,),
+            name=f"model-prefetch-{model_size}",
+            daemon=True
+        ).start()
+
+    def _prefetch_worker(self, model_size: str):
+        """
+        Load a model and park it in the pool (runs on prefetch thread).
+
+        Args:
+            model_size: Model size to load
+        """
+        try:
+            instance = self._load_model(model_size)
+            self.release(instance)
+        except Exception as e:
+            logger.warning(f"Prefetch of {model_size} model failed: {e}")
+        finally:
+            with self._released:
+                self._loading[model_size] -= 1
+                self._released.notify_all()
 
     def _load_model(self, model_size: str) -> ModelInstance:
         """
@@ -260,7 +481,7 @@ class ModelPool:
             if "out of memory" in str(e).lower():
                 logger.error(f"OOM loading {model_size}, attempting fallback")
                 with self._lock:
-                    self._stats['oom_fallbacks'] += 1
+                    self._stats.oom_fallbacks += 1
                 return self._fallback_to_smaller_model(model_size)
             raise
 
@@ -287,9 +508,11 @@ class ModelPool:
                     f"Falling back from {failed_size} to {smaller_size} due to OOM"
                 )
 
-                # Clear GPU memory before retry
-                self._clear_gpu_cache()
+                # Clear GPU memory before retry; a full collection, since
+                # cycles promoted to older generations can hold model-sized
+                # tensors and every reclaimable byte counts here
                 gc.collect()
+                self._clear_gpu_cache()
 
                 # Try to load smaller model
                 return self._load_model(smaller_size)
@@ -317,46 +540,82 @@ class ModelPool:
             model_id = id(instance)
             if model_id in self._loaded_models:
                 del self._loaded_models[model_id]
+            self._unload_count += 1
+            full_gc = self._unload_count % _FULL_GC_INTERVAL == 0
 
-        # Free memory
+        # Free memory - refcounting releases the weights on del; a young-
+        # generation pass picks up stray cycles, a full pass runs periodically
         del instance.model
-        gc.collect()
+        if full_gc:
+            gc.collect()
+        else:
+            gc.collect(0)
 
-        # Clear GPU cache if available
-        self._clear_gpu_cache()
+        # GPU cache is not emptied here: empty_cache() synchronizes the
+        # device and the allocator reuses freed blocks anyway. Callers that
+        # are about to load a model (or shut down) clear it once.
 
     def _clear_gpu_cache(self):
         """Clear GPU memory cache for CUDA or MPS."""
-        if torch.cuda.is_available():
+        if _CUDA_AVAILABLE:
             torch.cuda.empty_cache()
-        if torch.backends.mps.is_available():
+        if _MPS_AVAILABLE:
             torch.mps.empty_cache()
 
-    def _evict_lru_model(self):
+    def _evict_model(self) -> bool:
         """
-        Evict least recently used model to free memory.
+        Evict the coldest idle model to free memory.
+
+        Scores each model parked in the pool by its heat, a use count that
+        halves every _HEAT_HALF_LIFE_S seconds of idleness, and evicts the
+        lowest, breaking ties by last_used. Plain LRU across sizes lets a
+        handful of small-model jobs push out a heavily used large model
+        that costs far more to reload; the decayed count keeps the size
+        actually in demand resident while still letting a model that has
+        gone cold make room. Checked-out models are never candidates.
 
-        Uses LRU (Least Recently Used) policy based on last_used timestamp.
+        Returns:
+            True if a model was evicted, False if none was idle
         """
         with self._lock:
-            if not self._loaded_models:
-                logger.warning("No models to evict")
-                return
-
-            # Find LRU model
-            lru_id = min(
-                self._loaded_models.keys(),
-                key=lambda x: self._loaded_models[x].last_used
-            )
-            lru_instance = self._loaded_models[lru_id]
+            now = datetime.now()
+
+            def score(instance: ModelInstance):
+                return (instance.decayed_heat(now), instance.last_used)
+
+            while True:
+                idle = []
+                for model_queue in self._models.values():
+                    with model_queue.mutex:
+                        idle.extend(model_queue.queue)
+
+                if not idle:
+                    logger.debug("No idle models to evict")
+                    return False
+
+                victim = min(idle, key=score)
+
+                # Take the victim out of its queue so acquire() can't hand it
+                # out; if another thread just took it, pick again
+                model_queue = self._models[victim.model_size]
+                with model_queue.mutex:
+                    for idx, parked in enumerate(model_queue.queue):
+                        if parked is victim:
+                            del model_queue.queue[idx]
+                            model_queue.not_full.notify()
+                            break
+                    else:
+                        continue
+                break
 
             logger.info(
-                f"Evicting LRU model: {lru_instance.model_size} "
-                f"(last used: {lru_instance.last_used}, use_count: {lru_instance.use_count})"
+                f"Evicting model: {victim.model_size} "
+                f"(last used: {victim.last_used}, use_count: {victim.use_count})"
             )
 
-            self._stats['evictions'] += 1
-            self._unload_model(lru_instance)
+            self._stats.evictions += 1
+            self._unload_model(victim)
+            return True
 
     def _total_models_loaded(self) -> int:
         """
@@ -377,17 +636,16 @@ class ModelPool:
         """
         with self._lock:
             return {
-                **self._stats,
+                'hits': self._stats.hits,
+                'misses': self._stats.misses,
+                'evictions': self._stats.evictions,
+                'oom_fallbacks': self._stats.oom_fallbacks,
                 'total_loaded': self._total_models_loaded(),
                 'models_by_size': {
                     size: q.qsize()
                     for size, q in self._models.items()
                 },
-                'hit_rate': (
-                    self._stats['hits'] / (self._stats['hits'] + self._stats['misses'])
-                    if (self._stats['hits'] + self._stats['misses']) > 0
-                    else 0.0
-                )
+                'hit_rate': self._stats.hit_rate
             }
 
     def clear(self):
@@ -414,6 +672,9 @@ class ModelPool:
             self._models.clear()
             self._loaded_models.clear()
 
+        # One allocator sweep for the whole batch of unloads
+        self._clear_gpu_cache()
+
         logger.info("Model pool cleared")
 
 
@@ -478,6 +739,18 @@ def acquire_model(model_size: str = None, timeout: float = 300):
         pool.release(instance)
 
 
+def prefetch_model(model_size: str = None):
+    """
+    Warm the global model pool for an upcoming job.
+
+    Returns immediately; the model loads on a background thread.
+
+    Args:
+        model_size: Model size to warm (None = use default)
+    """
+    get_model_pool().prefetch(model_size)
+
+
 def get_pool_stats() -> dict:
     """
     Get statistics from global model pool.
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import json
 import os
+import tempfile
 import threading
 import time
 from contextlib import contextmanager
@@ -35,6 +36,9 @@ STAGES = {
     "saving": ("Saving output", 0),
 }
 
+# Display name per stage, for lookups on the render path
+_STAGE_DISPLAY = {key: display for key, (display, _) in STAGES.items()}
+
 
 @dataclass
 class ProgressState:
@@ -62,12 +66,29 @@ _console = Console()
 
 
 def _write_progress_file():
-    """Write current progress to JSON file for dashboard."""
+    """Write current progress to JSON file for dashboard.
+
+    Writes to a temp file and renames it over the real one, so the
+    dashboard never reads a half-written document. Each write gets its
+    own temp file, so concurrent writers can't replace each other's.
+    """
+    tmp_path = None
     try:
-        with open(PROGRESS_FILE, "w") as f:
+        with tempfile.NamedTemporaryFile(
+            "w", dir=PROGRESS_FILE.parent, prefix=".progress-", suffix=".tmp", delete=False
+        ) as f:
+            tmp_path = f.name
+            # Temp files are created 0600; keep progress.json world-readable
+            os.fchmod(f.fileno(), 0o644)
             json.dump(_current_progress.to_dict(), f, indent=2)
+        os.replace(tmp_path, PROGRESS_FILE)
     except Exception:
-        pass  # Non-critical, don't fail transcription
+        # Non-critical, don't fail transcription
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
 
 
 def _update_elapsed():
@@ -107,7 +128,7 @@ def set_stage(stage: str):
             _current_progress.stages_completed.append(_current_progress.stage)
 
         _current_progress.stage = stage
-        _current_progress.stage_display = STAGES.get(stage, (stage, 0))[0]
+        _current_progress.stage_display = _STAGE_DISPLAY.get(stage, stage)
         _current_progress.stage_started_at = datetime.now().isoformat()
         _current_progress.stage_elapsed_seconds = 0.0
         _update_elapsed()
@@ -172,7 +193,7 @@ def _build_progress_display() -> Panel:
     all_stages = ["loading", "transcribing", "aligning", "diarizing", "saving"]
 
     for stage_key in all_stages:
-        stage_name = STAGES[stage_key][0]
+        stage_name = _STAGE_DISPLAY[stage_key]
 
         if stage_key in state.stages_completed:
             status = "[green]\u2713[/green]"
@@ -213,34 +234,21 @@ class ProgressDisplay:
     def __init__(self, refresh_rate: float = 4):
         self._live: Optional[Live] = None
         self._refresh_rate = refresh_rate
-        self._stop_event = threading.Event()
-        self._thread: Optional[threading.Thread] = None
-
-    def _update_loop(self):
-        """Background thread to update display."""
-        while not self._stop_event.is_set():
-            if self._live:
-                self._live.update(_build_progress_display())
-            self._stop_event.wait(1 / self._refresh_rate)
 
     def start(self):
         """Start the progress display."""
+        # Live's own refresh thread re-renders via get_renderable each tick
         self._live = Live(
-            _build_progress_display(),
+            get_renderable=_build_progress_display,
             console=_console,
             refresh_per_second=self._refresh_rate,
+            auto_refresh=True,
             transient=False,
         )
         self._live.start()
-        self._stop_event.clear()
-        self._thread = threading.Thread(target=self._update_loop, daemon=True)
-        self._thread.start()
 
     def stop(self):
         """Stop the progress display."""
-        self._stop_event.set()
-        if self._thread:
-            self._thread.join(timeout=1)
         if self._live:
             self._live.stop()
             self._live = None
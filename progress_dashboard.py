@@ -6,17 +6,157 @@ Run with: python progress_dashboard.py
 Then open: http://localhost:8080
 """
 
+import gzip
+import hashlib
 import json
 import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
 
 from config import config
 
+try:
+    import orjson  # Optional: faster status encoding
+except ImportError:
+    orjson = None
+
 PORT = int(os.environ.get("DASHBOARD_PORT", "8890"))
 
+# Seconds a computed /api/status response is reused across requests
+STATUS_CACHE_TTL = 2.0
+
+# Log lines inspected when falling back to transcription.log
+LOG_TAIL_LINES = 50
+
+# Seconds between server-side change checks while clients are connected
+WATCH_INTERVAL = 1.0
+
+# Longest a /api/status?since=... request waits for a change
+LONG_POLL_TIMEOUT = 25.0
+
+# Seconds between SSE keep-alive comments when nothing has changed
+SSE_KEEPALIVE = 15.0
+
+PROGRESS_FILE = Path(__file__).parent / "progress.json"
+LOG_FILE = "transcription.log"
+
+_STARTING_RE = re.compile(r"Starting transcription of '([^']+)'")
+_DURATION_RE = re.compile(rb"Duration: ([\d.]+)")
+
+# Lowercased extension -> kind of file, so each entry is classified by
+# one dict lookup on its suffix
+_EXT_KINDS = {ext.lower(): "video" for ext in config.supported_video_formats}
+_EXT_KINDS.update({ext.lower(): "audio" for ext in config.supported_audio_formats})
+_EXT_KINDS[".txt"] = "transcript"
+
+# Shared by get_transcription_status() for its three folder scans
+_scan_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="dashboard-scan")
+
+# Transcript path -> (mtime_ns, duration) so unchanged files aren't re-read;
+# pruned to the transcripts seen by the latest scan
+_duration_cache = {}
+
+_status_cache = {"computed_at": 0.0, "body": b"", "gzip": b"", "etag": "", "fingerprint": ""}
+_status_cache_lock = threading.Lock()
+
+# Bumped by the watcher thread whenever the status fingerprint changes;
+# the watcher only runs while _subscribers (open SSE streams and long
+# polls) is non-zero. _watched_fingerprint is its latest fingerprint, or
+# None while it is idle and the last one may be stale.
+_status_version = 0
+_subscribers = 0
+_watched_fingerprint = None
+_status_changed = threading.Condition()
+
+
+def tail_lines(path, max_lines, block_size=8192):
+    """
+    Return the last max_lines lines of a file without reading all of it.
+
+    Reads fixed-size blocks backwards from the end until enough line
+    breaks have been seen.
+    """
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        data = b""
+        while pos > 0 and data.count(b"\n") <= max_lines:
+            read_size = min(block_size, pos)
+            pos -= read_size
+            f.seek(pos)
+            data = f.read(read_size) + data
+    return data.decode("utf-8", "replace").splitlines(keepends=True)[-max_lines:]
+
+
+def dumps(obj, sort_keys=False):
+    """Encode obj as compact JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+    return json.dumps(obj, sort_keys=sort_keys).encode()
+
+
+def file_kind(name):
+    """
+    Classify a filename by extension, lowercasing only the suffix.
+
+    Returns:
+        "video", "audio", "transcript", or None for anything else
+    """
+    dot = name.rfind(".")
+    return _EXT_KINDS.get(name[dot:].lower()) if dot != -1 else None
+
+
+def get_duration(path, mtime_ns):
+    """
+    Get the Duration metadata of a transcript, cached by mtime.
+
+    Args:
+        path: Transcript file path
+        mtime_ns: Current modification time of the file
+
+    Returns:
+        Duration string, "unknown" if absent or "error" if unreadable
+    """
+    cached = _duration_cache.get(path)
+    if cached and cached[0] == mtime_ns:
+        return cached[1]
+
+    # Read first few lines to get metadata
+    try:
+        with open(path, "rb") as tf:
+            content = tf.read(500)
+        duration_match = _DURATION_RE.search(content)
+        duration = duration_match.group(1).decode() if duration_match else "unknown"
+    except OSError:
+        duration = "error"
+
+    _duration_cache[path] = (mtime_ns, duration)
+    return duration
+
+
+def scan_folder(folder, kind):
+    """
+    List the files of one kind in a folder, stat-ing each match once.
+
+    Args:
+        folder: Directory to scan (missing folders yield nothing)
+        kind: File kind as returned by file_kind()
+
+    Returns:
+        List of (DirEntry, stat_result) tuples in directory order
+    """
+    if not os.path.exists(folder):
+        return []
+    with os.scandir(folder) as entries:
+        return [(entry, entry.stat()) for entry in entries if file_kind(entry.name) == kind]
+
 
 def get_transcription_status():
     """Gather current status of all transcription-related files."""
@@ -36,70 +176,54 @@ def get_transcription_status():
         "in_progress": None,
     }
 
-    # Check video folder
-    if os.path.exists(config.video_folder):
-        for f in os.listdir(config.video_folder):
-            if f.lower().endswith(config.supported_video_formats):
-                path = os.path.join(config.video_folder, f)
-                base = os.path.splitext(f)[0]
-                audio_exists = any(
-                    os.path.exists(os.path.join(config.work_folder, base + ext))
-                    for ext in config.supported_audio_formats
-                )
-                transcription_exists = os.path.exists(
-                    os.path.join(config.output_folder, base + ".txt")
-                )
-                status["videos"].append({
-                    "name": f,
-                    "size_mb": round(os.path.getsize(path) / (1024 * 1024), 1),
-                    "mtime": datetime.fromtimestamp(os.path.getmtime(path)).isoformat(),
-                    "audio_converted": audio_exists,
-                    "transcribed": transcription_exists,
-                })
-
-    # Check work folder (converted audio)
-    if os.path.exists(config.work_folder):
-        for f in os.listdir(config.work_folder):
-            if f.lower().endswith(config.supported_audio_formats) and not f.endswith(".backup"):
-                path = os.path.join(config.work_folder, f)
-                base = os.path.splitext(f)[0]
-                transcription_exists = os.path.exists(
-                    os.path.join(config.output_folder, base + ".txt")
-                )
-                status["audio_files"].append({
-                    "name": f,
-                    "size_mb": round(os.path.getsize(path) / (1024 * 1024), 1),
-                    "mtime": datetime.fromtimestamp(os.path.getmtime(path)).isoformat(),
-                    "transcribed": transcription_exists,
-                })
-
-    # Check transcriptions
-    if os.path.exists(config.output_folder):
-        for f in os.listdir(config.output_folder):
-            if f.endswith(".txt") and not f.endswith(".backup"):
-                path = os.path.join(config.output_folder, f)
-                size = os.path.getsize(path)
-                # Read first few lines to get metadata
-                try:
-                    with open(path, "r") as tf:
-                        content = tf.read(500)
-                    duration_match = re.search(r"Duration: ([\d.]+)", content)
-                    duration = duration_match.group(1) if duration_match else "unknown"
-                except:
-                    duration = "error"
-
-                status["transcriptions"].append({
-                    "name": f,
-                    "size_bytes": size,
-                    "mtime": datetime.fromtimestamp(os.path.getmtime(path)).isoformat(),
-                    "duration": duration,
-                })
+    # The three folder scans are independent stat-bound work (slow on
+    # network mounts), so run them concurrently and cross-reference after
+    transcriptions_future = _scan_pool.submit(scan_folder, config.output_folder, "transcript")
+    audio_future = _scan_pool.submit(scan_folder, config.work_folder, "audio")
+    videos_future = _scan_pool.submit(scan_folder, config.video_folder, "video")
+
+    transcribed_bases = set()
+    transcript_paths = set()
+    for entry, st in transcriptions_future.result():
+        transcribed_bases.add(os.path.splitext(entry.name)[0])
+        transcript_paths.add(entry.path)
+        status["transcriptions"].append({
+            "name": entry.name,
+            "size_bytes": st.st_size,
+            "mtime": datetime.fromtimestamp(st.st_mtime).isoformat(),
+            "duration": get_duration(entry.path, st.st_mtime_ns),
+        })
+
+    # Forget durations of transcripts that have since been removed
+    for path in list(_duration_cache):
+        if path not in transcript_paths:
+            _duration_cache.pop(path, None)
+
+    audio_bases = set()
+    for entry, st in audio_future.result():
+        base = os.path.splitext(entry.name)[0]
+        audio_bases.add(base)
+        status["audio_files"].append({
+            "name": entry.name,
+            "size_mb": round(st.st_size / (1024 * 1024), 1),
+            "mtime": datetime.fromtimestamp(st.st_mtime).isoformat(),
+            "transcribed": base in transcribed_bases,
+        })
+
+    for entry, st in videos_future.result():
+        base = os.path.splitext(entry.name)[0]
+        status["videos"].append({
+            "name": entry.name,
+            "size_mb": round(st.st_size / (1024 * 1024), 1),
+            "mtime": datetime.fromtimestamp(st.st_mtime).isoformat(),
+            "audio_converted": base in audio_bases,
+            "transcribed": base in transcribed_bases,
+        })
 
     # Try to read current progress from progress.json
-    progress_file = Path(__file__).parent / "progress.json"
-    if progress_file.exists():
+    if PROGRESS_FILE.exists():
         try:
-            with open(progress_file, "r") as pf:
+            with open(PROGRESS_FILE, "r") as pf:
                 progress_data = json.load(pf)
 
             if progress_data.get("file_name") and progress_data.get("stage") != "idle":
@@ -119,15 +243,13 @@ def get_transcription_status():
 
     # Fallback to log file if no progress.json
     if status["in_progress"] is None:
-        log_file = "transcription.log"
-        if os.path.exists(log_file):
+        if os.path.exists(LOG_FILE):
             try:
-                with open(log_file, "r") as lf:
-                    lines = lf.readlines()[-50:]  # Last 50 lines
+                lines = tail_lines(LOG_FILE, LOG_TAIL_LINES)
 
                 for line in reversed(lines):
                     if "Starting transcription of" in line:
-                        match = re.search(r"Starting transcription of '([^']+)'", line)
+                        match = _STARTING_RE.search(line)
                         if match:
                             status["in_progress"] = {
                                 "file": match.group(1),
@@ -147,23 +269,223 @@ def get_transcription_status():
     return status
 
 
+def get_fingerprint():
+    """
+    Cheap digest of everything the status is derived from.
+
+    Only names, sizes and mtimes are hashed - no file contents are read -
+    so this is safe to call every WATCH_INTERVAL.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for folder in (config.video_folder, config.work_folder, config.output_folder):
+        try:
+            with os.scandir(folder) as entries:
+                for entry in sorted(entries, key=lambda e: e.name):
+                    st = entry.stat()
+                    digest.update(f"{entry.path}|{st.st_size}|{st.st_mtime_ns}\n".encode())
+        except OSError:
+            digest.update(f"{folder}|missing\n".encode())
+    for path in (PROGRESS_FILE, LOG_FILE):
+        try:
+            st = os.stat(path)
+            digest.update(f"{path}|{st.st_size}|{st.st_mtime_ns}\n".encode())
+        except OSError:
+            pass
+    return digest.hexdigest()
+
+
+def get_status_response(force=False):
+    """
+    Return the encoded /api/status body, its ETag and its fingerprint.
+
+    Status is recomputed at most once per STATUS_CACHE_TTL; requests in
+    between share the cached bytes. The ETag ignores the timestamp field
+    so unchanged folders keep the same tag across recomputations. The
+    fingerprint is taken just before the status is built, so a change
+    made during the build shows up as a new fingerprint on the next poll.
+
+    Args:
+        force: Recompute even if the cached body is still fresh
+
+    Returns:
+        Tuple of (JSON body bytes, gzipped body bytes, quoted ETag string,
+        fingerprint the body was built from)
+    """
+    with _status_cache_lock:
+        now = time.monotonic()
+        if force or now - _status_cache["computed_at"] >= STATUS_CACHE_TTL:
+            fingerprint = get_fingerprint()
+            status = get_transcription_status()
+            timestamp = status.pop("timestamp")
+            digest = hashlib.blake2b(dumps(status, sort_keys=True), digest_size=8).hexdigest()
+            status = {"timestamp": timestamp, **status}
+            # Compact encoding so the body also fits on one SSE data line
+            _status_cache["body"] = dumps(status)
+            _status_cache["gzip"] = gzip.compress(_status_cache["body"])
+            _status_cache["etag"] = f'"{digest}"'
+            _status_cache["fingerprint"] = fingerprint
+            _status_cache["computed_at"] = now
+        return (
+            _status_cache["body"],
+            _status_cache["gzip"],
+            _status_cache["etag"],
+            _status_cache["fingerprint"],
+        )
+
+
+@contextmanager
+def subscribed():
+    """Count the calling request as a watcher subscriber while it runs."""
+    global _subscribers
+
+    with _status_changed:
+        _subscribers += 1
+        _status_changed.notify_all()
+    try:
+        yield
+    finally:
+        with _status_changed:
+            _subscribers -= 1
+
+
+def watch_for_changes():
+    """
+    Watch the transcription folders and wake SSE clients on changes.
+
+    Runs forever on a daemon thread started by main(), but sleeps on
+    _status_changed without touching the filesystem while no client is
+    subscribed.
+    """
+    global _status_version, _watched_fingerprint
+
+    last_fingerprint = None
+    while True:
+        with _status_changed:
+            if not _subscribers:
+                _watched_fingerprint = None
+                _status_changed.wait_for(lambda: _subscribers > 0)
+        try:
+            fingerprint = get_fingerprint()
+            changed = fingerprint != last_fingerprint
+            if changed:
+                last_fingerprint = fingerprint
+                get_status_response(force=True)
+            with _status_changed:
+                _watched_fingerprint = fingerprint
+                if changed:
+                    _status_version += 1
+                _status_changed.notify_all()
+        except Exception as e:
+            print(f"Change watcher error: {e}")
+        time.sleep(WATCH_INTERVAL)
+
+
 class DashboardHandler(SimpleHTTPRequestHandler):
+    # Keep-alive lets polling browsers reuse one connection
+    protocol_version = "HTTP/1.1"
+
     def do_GET(self):
-        if self.path == "/" or self.path == "/index.html":
+        url = urlsplit(self.path)
+        if url.path == "/" or url.path == "/index.html":
             self.send_response(200)
             self.send_header("Content-type", "text/html")
-            self.end_headers()
-            self.wfile.write(HTML_TEMPLATE.encode())
-        elif self.path == "/api/status":
-            self.send_response(200)
-            self.send_header("Content-type", "application/json")
-            self.send_header("Access-Control-Allow-Origin", "*")
-            self.end_headers()
-            status = get_transcription_status()
-            self.wfile.write(json.dumps(status, indent=2).encode())
+            self.send_body(HTML_TEMPLATE_BYTES, HTML_TEMPLATE_GZIP)
+        elif url.path == "/api/status":
+            since = parse_qs(url.query).get("since", [""])[0]
+            if since:
+                self.long_poll_status(since)
+                return
+            body, gzip_body, etag, fingerprint = get_status_response()
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            self.send_json(body, gzip_body, etag=etag, fingerprint=fingerprint)
+        elif url.path == "/api/events":
+            self.stream_events()
         else:
             self.send_error(404)
 
+    def send_body(self, body, gzip_body=None):
+        """Finish headers and write the body, gzipped if the client accepts it."""
+        if gzip_body is not None:
+            self.send_header("Vary", "Accept-Encoding")
+            if "gzip" in self.headers.get("Accept-Encoding", ""):
+                self.send_header("Content-Encoding", "gzip")
+                body = gzip_body
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_json(self, body, gzip_body=None, etag=None, fingerprint=None):
+        """Send a 200 JSON response with caching and fingerprint headers."""
+        self.send_response(200)
+        self.send_header("Content-type", "application/json")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Expose-Headers", "X-Status-Fingerprint")
+        self.send_header("Cache-Control", "no-cache")
+        if etag:
+            self.send_header("ETag", etag)
+        if fingerprint:
+            self.send_header("X-Status-Fingerprint", fingerprint)
+        self.send_body(body, gzip_body)
+
+    def long_poll_status(self, since):
+        """
+        Hold the request until the fingerprint differs from `since`.
+
+        Waits on the watcher thread's fingerprint rather than scanning the
+        folders itself, so any number of pending polls cost one scan per
+        WATCH_INTERVAL; the full status is built once something has
+        changed. Times out with {"unchanged": true} after LONG_POLL_TIMEOUT.
+        """
+        with subscribed():
+            with _status_changed:
+                _status_changed.wait_for(
+                    lambda: _watched_fingerprint not in (None, since), timeout=LONG_POLL_TIMEOUT
+                )
+                fingerprint = _watched_fingerprint
+
+        if fingerprint in (None, since):
+            self.send_json(b'{"unchanged": true}', fingerprint=since)
+            return
+        # The watcher rebuilt the cached status before publishing the change
+        body, gzip_body, etag, fingerprint = get_status_response()
+        self.send_json(body, gzip_body, etag=etag, fingerprint=fingerprint)
+
+    def stream_events(self):
+        """Push the status as Server-Sent Events whenever it changes."""
+        self.send_response(200)
+        self.send_header("Content-type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        with _status_changed:
+            seen_version = _status_version
+        try:
+            with subscribed():
+                body = get_status_response()[0]
+                self.wfile.write(b"data: " + body + b"\n\n")
+                self.wfile.flush()
+                while True:
+                    with _status_changed:
+                        _status_changed.wait_for(
+                            lambda: _status_version != seen_version, timeout=SSE_KEEPALIVE
+                        )
+                        changed = _status_version != seen_version
+                        seen_version = _status_version
+                    if changed:
+                        body = get_status_response()[0]
+                        self.wfile.write(b"data: " + body + b"\n\n")
+                    else:
+                        self.wfile.write(b": keepalive\n\n")
+                    self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # Browser tab closed
+
     def log_message(self, format, *args):
         pass  # Suppress logging
 
@@ -283,20 +605,12 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             <ul class="file-list" id="transcription-list"></ul>
         </div>
 
-        <p class="refresh-info">Auto-refreshes every 5 seconds | Last update: <span id="last-update"></span></p>
+        <p class="refresh-info">
+            Updates live as files change | Last update: <span id="last-update"></span>
+        </p>
     </div>
 
     <script>
-        async function fetchStatus() {
-            try {
-                const resp = await fetch('/api/status');
-                const data = await resp.json();
-                updateUI(data);
-            } catch (e) {
-                console.error('Failed to fetch status:', e);
-            }
-        }
-
         function updateUI(data) {
             // Config
             document.getElementById('config-stats').innerHTML = `
@@ -410,7 +724,9 @@ HTML_TEMPLATE = """<!DOCTYPE html>
                 transcriptionList.innerHTML = data.transcriptions.map(t => `
                     <li class="file-item">
                         <span class="file-name">${t.name}</span>
-                        <span class="file-meta">${(t.size_bytes / 1024).toFixed(1)} KB | ${t.duration}s</span>
+                        <span class="file-meta">
+                            ${(t.size_bytes / 1024).toFixed(1)} KB | ${t.duration}s
+                        </span>
                         <span class="badge badge-done">Done</span>
                     </li>
                 `).join('');
@@ -420,20 +736,68 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             document.getElementById('last-update').textContent = new Date().toLocaleTimeString();
         }
 
-        // Initial fetch and set interval
-        fetchStatus();
-        setInterval(fetchStatus, 5000);
+        // Live updates via Server-Sent Events; long-poll on the status
+        // fingerprint only while the event stream is unavailable
+        let polling = false;
+        let lastFingerprint = '';
+
+        async function longPoll() {
+            while (polling) {
+                try {
+                    const url = '/api/status?since=' + encodeURIComponent(lastFingerprint);
+                    const resp = await fetch(url);
+                    const data = await resp.json();
+                    lastFingerprint = resp.headers.get('X-Status-Fingerprint') || lastFingerprint;
+                    if (!data.unchanged) {
+                        updateUI(data);
+                    }
+                } catch (e) {
+                    console.error('Failed to fetch status:', e);
+                    await new Promise(resolve => setTimeout(resolve, 5000));
+                }
+            }
+        }
+
+        function startPolling() {
+            if (!polling) {
+                polling = true;
+                longPoll();
+            }
+        }
+
+        function stopPolling() {
+            polling = false;
+        }
+
+        if (window.EventSource) {
+            const events = new EventSource('/api/events');
+            events.onopen = stopPolling;
+            events.onmessage = e => updateUI(JSON.parse(e.data));
+            events.onerror = startPolling;
+        } else {
+            startPolling();
+        }
     </script>
 </body>
 </html>
 """
 
+# Indentation stripped (line breaks kept so the inline JS stays valid)
+# and compressed once, rather than on every page load
+HTML_TEMPLATE_BYTES = "\n".join(
+    line.strip() for line in HTML_TEMPLATE.splitlines() if line.strip()
+).encode()
+HTML_TEMPLATE_GZIP = gzip.compress(HTML_TEMPLATE_BYTES, compresslevel=9)
+
 
 def main():
     print(f"Starting Transcription Progress Dashboard on http://localhost:{PORT}")
     print("Press Ctrl+C to stop")
 
-    server = HTTPServer(("", PORT), DashboardHandler)
+    # One thread per connection so a slow status scan doesn't block other tabs
+    server = ThreadingHTTPServer(("", PORT), DashboardHandler)
+    server.daemon_threads = True
+    threading.Thread(target=watch_for_changes, name="dashboard-watcher", daemon=True).start()
     try:
         server.serve_forever()
     except KeyboardInterrupt:
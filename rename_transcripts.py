@@ -14,12 +14,29 @@ from pathlib import Path
 # Configuration
 TRANSCRIBED_FOLDER = "./transcribed"
 MAX_SUMMARY_LENGTH = 40  # Max characters for summary portion
+CONTENT_READ_BYTES = 16384  # Enough for the header plus ~50 lines of content
+
+# Common meeting patterns, in priority order
+SUMMARY_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?:talk(?:ing)?|discuss(?:ing)?|about|regarding|for|on)\s+([A-Z][a-zA-Z\s]{3,30})",
+    r"([A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,3})\s+(?:meeting|sync|standup|call)",
+    r"(?:work(?:ing)?\s+on|working\s+on)\s+([A-Za-z\s]{3,25})",
+))
+
+# Leading filler words stripped before falling back to the first words
+GREETINGS = ('hey', 'hi', 'hello', 'okay', 'alright', 'so', 'um', 'uh', 'yeah', 'well')
+
+# "YYYY-MM-DD HH-MM-SS" prefix, and the same followed by " - Summary"
+TIMESTAMP_RE = re.compile(r'^(\d{4}-\d{2}-\d{2}\s+\d{2}-\d{2}-\d{2})')
+RENAMED_RE = re.compile(r'^\d{4}-\d{2}-\d{2}\s+\d{2}-\d{2}-\d{2}\s+-\s+')
 
 
 def extract_content(file_path: str) -> str:
     """Extract transcript content, skipping metadata header."""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+    # Only the opening lines are used, so don't read whole transcripts
+    with open(file_path, 'r', encoding='utf-8', errors='replace',
+              buffering=CONTENT_READ_BYTES) as f:
+        lines = f.read(CONTENT_READ_BYTES).split('\n')
 
     # Skip metadata lines (start with #) and empty lines
     content_lines = []
@@ -33,28 +50,38 @@ def extract_content(file_path: str) -> str:
     return ' '.join(content_lines[:50])  # First ~50 lines of content
 
 
+def strip_greetings(content: str, max_greetings: int = 2) -> str:
+    """Strip up to max_greetings leading filler words, e.g. "Hey, so ..."."""
+    for _ in range(max_greetings):
+        prefix = content[:8].lower()
+        for greeting in GREETINGS:
+            end = len(greeting)
+            # Whole words only, so "something" doesn't lose its "so"
+            if prefix.startswith(greeting) and (len(content) == end or not content[end].isalnum()):
+                content = content[end:].lstrip()
+                if content[:1] in (',', '.'):
+                    content = content[1:].lstrip()
+                break
+        else:
+            break
+    return content
+
+
 def suggest_summary(content: str) -> str:
     """Generate a short summary suggestion from content."""
     # Clean up the content
     content = content.replace('\n', ' ').strip()
 
     # Look for common meeting patterns
-    patterns = [
-        r"(?:talk(?:ing)?|discuss(?:ing)?|about|regarding|for|on)\s+([A-Z][a-zA-Z\s]{3,30})",
-        r"([A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,3})\s+(?:meeting|sync|standup|call)",
-        r"(?:work(?:ing)?\s+on|working\s+on)\s+([A-Za-z\s]{3,25})",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, content)
+    for pattern in SUMMARY_PATTERNS:
+        match = pattern.search(content)
         if match:
             summary = match.group(1).strip()
             if len(summary) > 3:
                 return summary[:MAX_SUMMARY_LENGTH]
 
     # Fall back to first few words after common greetings
-    content = re.sub(r'^(hey|hi|hello|okay|alright|so|um|uh|yeah|well)\s*[,.]?\s*', '', content, flags=re.I)
-    content = re.sub(r'^(hey|hi|hello|okay|alright|so|um|uh|yeah|well)\s*[,.]?\s*', '', content, flags=re.I)
+    content = strip_greetings(content)
 
     # Get first substantive phrase
     words = content.split()[:8]
@@ -64,7 +91,7 @@ def suggest_summary(content: str) -> str:
 def get_original_name(filename: str) -> str:
     """Extract the original base name (timestamp portion) from a filename."""
     # Pattern: "YYYY-MM-DD HH-MM-SS" possibly followed by " - Summary"
-    match = re.match(r'^(\d{4}-\d{2}-\d{2}\s+\d{2}-\d{2}-\d{2})', filename)
+    match = TIMESTAMP_RE.match(filename)
     if match:
         return match.group(1)
     # If no timestamp pattern, return filename without extension
@@ -74,36 +101,41 @@ def get_original_name(filename: str) -> str:
 def is_already_renamed(filename: str) -> bool:
     """Check if file already has a summary suffix."""
     base = os.path.splitext(filename)[0]
-    return ' - ' in base and re.match(r'^\d{4}-\d{2}-\d{2}\s+\d{2}-\d{2}-\d{2}\s+-\s+', base)
+    return ' - ' in base and RENAMED_RE.match(base)
 
 
 def rename_with_symlink(folder: str, old_name: str, new_name: str) -> bool:
     """Rename file and create symlink from original name."""
-    old_path = os.path.join(folder, old_name)
-    new_path = os.path.join(folder, new_name)
-
     # Get the original timestamp-based name for symlink
     original_base = get_original_name(old_name)
     symlink_name = original_base + ".txt"
-    symlink_path = os.path.join(folder, symlink_name)
 
+    # Resolve the folder once and work relative to it
+    dir_fd = os.open(folder, os.O_RDONLY)
+    renamed = False
     try:
-        # Rename the file
-        os.rename(old_path, new_path)
+        # Rename the file (atomic, overwrites like POSIX rename)
+        os.replace(old_name, new_name, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+        renamed = True
 
         # Create symlink from original name to new name (if different)
-        if symlink_name != new_name and not os.path.exists(symlink_path):
-            # Create relative symlink
-            os.symlink(new_name, symlink_path)
-            print(f"  Created symlink: {symlink_name} -> {new_name}")
+        if symlink_name != new_name:
+            try:
+                # Create relative symlink
+                os.symlink(new_name, symlink_name, dir_fd=dir_fd)
+                print(f"  Created symlink: {symlink_name} -> {new_name}")
+            except FileExistsError:
+                pass
 
         return True
     except Exception as e:
         print(f"  Error: {e}")
         # Try to restore if rename succeeded but symlink failed
-        if os.path.exists(new_path) and not os.path.exists(old_path):
-            os.rename(new_path, old_path)
+        if renamed:
+            os.replace(new_name, old_name, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
         return False
+    finally:
+        os.close(dir_fd)
 
 
 def main():
@@ -112,16 +144,21 @@ def main():
         print(f"Folder not found: {folder}")
         sys.exit(1)
 
-    # Get all .txt files (not symlinks, not backups)
-    txt_files = [
-        f for f in os.listdir(folder)
-        if f.endswith('.txt')
-        and not f.endswith('.backup')
-        and not os.path.islink(folder / f)
-    ]
+    # Get all regular .txt files (not symlinks, not directories, not backups),
+    # keyed by mtime so the sort compares precomputed tuples. The type test
+    # uses the readdir d_type, so only the files that pass the filter are
+    # stat-ed.
+    with os.scandir(folder) as entries:
+        txt_entries = [
+            (entry.stat().st_mtime, entry.name) for entry in entries
+            if entry.name.endswith('.txt')
+            and not entry.name.endswith('.backup')
+            and entry.is_file(follow_symlinks=False)
+        ]
 
     # Sort by modification time (newest first)
-    txt_files.sort(key=lambda f: os.path.getmtime(folder / f), reverse=True)
+    txt_entries.sort(reverse=True)
+    txt_files = [name for _, name in txt_entries]
 
     if not txt_files:
         print("No transcript files found.")
@@ -4,6 +4,26 @@
 import subprocess
 import os
 import sys
+import threading
+from collections import deque
+
+STDERR_TAIL_LINES = 50
+
+
+def drain_tail(stream, tail):
+    """Read a process stream to EOF, keeping only its last lines in tail."""
+    for line in stream:
+        tail.append(line)
+    stream.close()
+
+
+def remove_partial(path):
+    """Delete a partially written output so it isn't mistaken for a repair."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
 
 def repair_audio(input_file):
     """Aggressively repair audio file for Whisper compatibility."""
@@ -19,34 +39,67 @@ def repair_audio(input_file):
     print(f"Output: {output_file}")
     
     try:
-        # More aggressive repair: convert to WAV first, then to MP3
-        # This often fixes corrupted audio streams
-        wav_temp = f"./work/{base_name}_temp.wav"
-        
-        # Step 1: Convert to WAV with specific settings
-        print("Step 1: Converting to WAV...")
-        subprocess.run([
-            "ffmpeg", "-y", "-i", input_file,
+        # More aggressive repair: decode to raw PCM, then re-encode to MP3.
+        # This often fixes corrupted audio streams. The PCM is piped
+        # straight into the encoder instead of going through a temp WAV.
+        decode_cmd = [
+            "ffmpeg", "-y", "-nostdin", "-nostats", "-loglevel", "error",
+            "-threads", "0", "-i", input_file,
+            "-f", "s16le",
             "-acodec", "pcm_s16le",  # Standard PCM encoding
             "-ar", "16000",           # 16kHz sample rate (good for speech)
             "-ac", "1",               # Mono
-            wav_temp
-        ], check=True, capture_output=True)
-        
-        # Step 2: Convert WAV back to MP3
-        print("Step 2: Converting WAV to MP3...")
-        subprocess.run([
-            "ffmpeg", "-y", "-i", wav_temp,
+            "pipe:1"
+        ]
+        encode_cmd = [
+            "ffmpeg", "-y", "-nostdin", "-nostats", "-loglevel", "error",
+            "-threads", "0",
+            "-f", "s16le", "-ar", "16000", "-ac", "1", "-i", "pipe:0",
             "-acodec", "libmp3lame",
             "-ar", "16000",
             "-ac", "1",
             "-ab", "64k",
             output_file
-        ], check=True, capture_output=True)
-        
-        # Clean up temp file
-        if os.path.exists(wav_temp):
-            os.remove(wav_temp)
+        ]
+
+        print("Decoding to PCM and re-encoding to MP3...")
+        decode = subprocess.Popen(decode_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        try:
+            encode = subprocess.Popen(encode_cmd, stdin=decode.stdout,
+                                      stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        except BaseException:
+            # Don't leave the decoder running with nobody reading its output
+            decode.kill()
+            decode.wait()
+            decode.stdout.close()
+            decode.stderr.close()
+            raise
+        decode.stdout.close()  # Let decoder see SIGPIPE if the encoder dies
+
+        # Drain both stderr pipes concurrently so neither ffmpeg blocks on a
+        # full pipe, keeping only the tail of the progress chatter for errors
+        decode_err = deque(maxlen=STDERR_TAIL_LINES)
+        encode_err = deque(maxlen=STDERR_TAIL_LINES)
+        readers = [
+            threading.Thread(target=drain_tail, args=(decode.stderr, decode_err)),
+            threading.Thread(target=drain_tail, args=(encode.stderr, encode_err)),
+        ]
+        for reader in readers:
+            reader.start()
+        encode.wait()
+        decode.wait()
+        for reader in readers:
+            reader.join()
+
+        # Encoder first: when it dies, the decoder only fails with SIGPIPE
+        if encode.returncode != 0:
+            raise subprocess.CalledProcessError(
+                encode.returncode, encode_cmd, stderr=b"".join(encode_err)
+            )
+        if decode.returncode != 0:
+            raise subprocess.CalledProcessError(
+                decode.returncode, decode_cmd, stderr=b"".join(decode_err)
+            )
             
         print(f"Successfully repaired: {output_file}")
         print(f"File size: {os.path.getsize(output_file) / (1024*1024):.1f}MB")
@@ -54,9 +107,13 @@ def repair_audio(input_file):
         return output_file
         
     except subprocess.CalledProcessError as e:
+        remove_partial(output_file)
         print(f"FFmpeg error: {e.stderr.decode() if e.stderr else str(e)}")
         return None
-    except Exception as e:
+    except BaseException as e:
+        remove_partial(output_file)
+        if not isinstance(e, Exception):
+            raise
         print(f"Error: {e}")
         return None
 
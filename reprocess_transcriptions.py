@@ -12,6 +12,7 @@ Usage:
 Options:
     --execute          Actually perform changes (default is dry-run)
     --repetition-only  Only reprocess files with repetition artifacts
+    --jobs N           Worker processes for transcription analysis (default: CPU count)
 """
 from __future__ import annotations
 
@@ -20,19 +21,144 @@ import logging
 import os
 import re
 import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import List, Optional, Tuple
 
 from config import config
 
+try:
+    import ahocorasick  # Optional: single-pass keyword matching
+except ImportError:
+    ahocorasick = None
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(levelname)s - %(message)s",
 )
 logger = logging.getLogger(__name__)
 
+_SENT_SPLIT_RE = re.compile(r"[.!?]+")
+_INVALID_FN_RE = re.compile(r'[<>:"/\\|?*]')
+
+# Sentences containing these are skipped when picking a fallback summary
+_GREETINGS_RE = re.compile(
+    "|".join(
+        re.escape(g)
+        for g in (
+            "thank you", "hello", "hi everyone", "hey guys", "good morning",
+            "good afternoon", "hey everyone", "hi there", "welcome",
+        )
+    ),
+    re.IGNORECASE,
+)
+
+# Polynomial rolling hash parameters for the repetition detector
+_HASH_MOD = (1 << 61) - 1
+_HASH_BASE = 1_000_003
+
+# Meeting type patterns. Each table is ordered longest pattern first so the
+# most specific match wins; keep that order when adding entries.
+MEETING_TYPES = {
+    "sprint planning": "Sprint Planning",
+    "retrospective": "Retro",
+    "presentation": "Presentation",
+    "one-on-one": "1on1",
+    "refinement": "Refinement",
+    "brainstorm": "Brainstorm",
+    "all hands": "All Hands",
+    "town hall": "Town Hall",
+    "interview": "Interview",
+    "stand-up": "Standup",
+    "stand up": "Standup",
+    "kick-off": "Kickoff",
+    "planning": "Planning",
+    "grooming": "Grooming",
+    "training": "Training",
+    "workshop": "Workshop",
+    "check-in": "Check-in",
+    "check in": "Check-in",
+    "standup": "Standup",
+    "kickoff": "Kickoff",
+    "backlog": "Backlog",
+    "retro ": "Retro",
+    "weekly": "Weekly",
+    "review": "Review",
+    "daily": "Daily",
+    "demo": "Demo",
+    "sync": "Sync",
+    "1:1": "1on1",
+}
+
+# Project/product patterns
+PROJECTS = {
+    "transcription": "Transcription",
+    "simulation": "Simulation",
+    "assessment": "Assessment",
+    "curriculum": "Curriculum",
+    "analytics": "Analytics",
+    "dashboard": "Dashboard",
+}
+
+# Technical topic patterns
+TOPICS = {
+    "infrastructure": "Infra",
+    "architecture": "Architecture",
+    "performance": "Performance",
+    "deployment": "Deployment",
+    "postmortem": "Postmortem",
+    "terraform": "Terraform",
+    "migration": "Migration",
+    "database": "Database",
+    "frontend": "Frontend",
+    "security": "Security",
+    "incident": "Incident",
+    "backend": "Backend",
+    "testing": "Testing",
+    "bug fix": "Bug Fix",
+    "hot fix": "Hotfix",
+    "release": "Release",
+    "hotfix": "Hotfix",
+    "design": "Design",
+    "sprint": "Sprint",
+    "outage": "Outage",
+    "kafka": "Kafka",
+    "infra": "Infra",
+    "api ": "API",
+    "rca": "RCA",
+}
+
+# Team name patterns
+TEAMS = {
+    "engineering": "Engineering",
+    "product": "Product",
+    "devops": "DevOps",
+    "sre": "SRE",
+}
+
+_KEYWORD_BYTES = {
+    pattern: pattern.encode()
+    for patterns in (MEETING_TYPES, PROJECTS, TOPICS, TEAMS)
+    for pattern in patterns
+}
+
+
+def _build_keyword_automaton():
+    """Build one Aho-Corasick automaton over every summary keyword."""
+    automaton = ahocorasick.Automaton()
+    for patterns in (MEETING_TYPES, PROJECTS, TOPICS, TEAMS):
+        for pattern in patterns:
+            automaton.add_word(pattern, pattern)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton() if ahocorasick else None
+
 
 @dataclass
 class TranscriptionAnalysis:
@@ -66,48 +192,94 @@ class ConvertedAudioAnalysis:
 
 
 def parse_transcription_metadata(file_path: str) -> dict:
-    """Parse metadata from a transcription file."""
+    """
+    Parse metadata from a transcription file.
+
+    The "# key: value" header is read line by line; the body after it is read
+    in one call into the "_content" key.
+    """
     metadata = {}
-    content_lines = []
-    in_metadata = True
 
     with open(file_path, "r", encoding="utf-8") as f:
+        first_line = ""
         for line in f:
-            if in_metadata and line.startswith("# "):
+            if line.startswith("# "):
                 if ": " in line:
                     key, value = line[2:].split(": ", 1)
                     metadata[key.strip()] = value.strip()
-            elif in_metadata and line.strip() == "":
-                in_metadata = False
-            else:
-                in_metadata = False
-                content_lines.append(line)
+                continue
+            # A blank line ends the header; any other line is already content
+            if line.strip() != "":
+                first_line = line
+            break
+
+        metadata["_content"] = (first_line + f.read()).strip()
 
-    metadata["_content"] = "".join(content_lines).strip()
     return metadata
 
 
+@lru_cache(maxsize=None)
+def _media_index(folder: str, formats: tuple[str, ...]) -> dict[str, os.DirEntry]:
+    """
+    Map base name -> DirEntry for the media files in a folder.
+
+    One scandir per folder replaces probing every extension per lookup. If a
+    base name exists with several extensions, the one listed first in formats
+    wins, as it did when the extensions were probed in order. Extensions match
+    case-insensitively (Clip.MP4 counts as .mp4), as the exists() probes did on
+    macOS's case-insensitive filesystem. Entries are not stat'ed here;
+    _media_lookup stats only the ones a transcription actually matches. Cached for the life of the process, which is a single analysis run.
+    """
+    index: dict[str, os.DirEntry] = {}
+    ranks: dict[str, int] = {}
+    rank_of = {ext.lower(): rank for rank, ext in reversed(list(enumerate(formats)))}
+
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                base_name, ext = os.path.splitext(entry.name)
+                rank = rank_of.get(ext.lower())
+                if rank is None or rank >= ranks.get(base_name, len(formats)):
+                    continue
+                # d_type answers is_symlink() for free; only links pay a stat
+                if entry.is_symlink() and not os.path.exists(entry.path):
+                    continue  # Dangling symlink
+                index[base_name] = entry
+                ranks[base_name] = rank
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+
+    return index
+
+
+def _media_lookup(
+    folder: str, formats: tuple[str, ...], base_name: str
+) -> tuple[str, int, float] | None:
+    """Return (path, size, mtime) of base_name's media file in folder, if any."""
+    entry = _media_index(folder, formats).get(base_name)
+    if entry is None:
+        return None
+    try:
+        stat = entry.stat()  # DirEntry caches this, so each file is stat'ed once
+    except OSError:
+        return None
+    return entry.path, stat.st_size, stat.st_mtime
+
+
 def find_source_file(transcription_name: str) -> tuple[str | None, int | None]:
     """Find the source audio/video file for a transcription."""
     base_name = os.path.splitext(transcription_name)[0]
 
-    # Check work folder for converted audio
-    for ext in config.supported_audio_formats:
-        audio_path = os.path.join(config.work_folder, base_name + ext)
-        if os.path.exists(audio_path):
-            return audio_path, os.path.getsize(audio_path)
-
-    # Check video folder for original video
-    for ext in config.supported_video_formats:
-        video_path = os.path.join(config.video_folder, base_name + ext)
-        if os.path.exists(video_path):
-            return video_path, os.path.getsize(video_path)
-
-    # Check audio folder
-    for ext in config.supported_audio_formats:
-        audio_path = os.path.join(config.audio_folder, base_name + ext)
-        if os.path.exists(audio_path):
-            return audio_path, os.path.getsize(audio_path)
+    # Check work folder for converted audio, then the original video, then
+    # the audio folder
+    for folder, formats in (
+        (config.work_folder, config.supported_audio_formats),
+        (config.video_folder, config.supported_video_formats),
+        (config.audio_folder, config.supported_audio_formats),
+    ):
+        match = _media_lookup(folder, formats, base_name)
+        if match:
+            return match[0], match[1]
 
     return None, None
 
@@ -124,9 +296,8 @@ def estimate_expected_words(audio_size_bytes: int, is_video: bool = False) -> in
     if is_video:
         audio_size_bytes = audio_size_bytes // 10  # Rough estimate
 
-    seconds = audio_size_bytes / 8000  # 64kbps = 8KB/s
-    expected_words = int(seconds * 2.5)
-    return expected_words
+    # bytes / 8000 (64kbps = 8KB/s) * 2.5 words/s, kept in integer arithmetic
+    return audio_size_bytes * 5 // 16000
 
 
 def extract_summary_from_content(content: str, max_length: int = 50) -> str | None:
@@ -142,111 +313,43 @@ def extract_summary_from_content(content: str, max_length: int = 50) -> str | No
     if not content or len(content) < 20:
         return None
 
-    content_lower = content.lower()
-
-    # Meeting type patterns (ordered by specificity)
-    meeting_types = {
-        "stand-up": "Standup",
-        "standup": "Standup",
-        "stand up": "Standup",
-        "retrospective": "Retro",
-        "retro ": "Retro",
-        "kickoff": "Kickoff",
-        "kick-off": "Kickoff",
-        "one-on-one": "1on1",
-        "1:1": "1on1",
-        "all hands": "All Hands",
-        "town hall": "Town Hall",
-        "planning": "Planning",
-        "sprint planning": "Sprint Planning",
-        "backlog": "Backlog",
-        "grooming": "Grooming",
-        "refinement": "Refinement",
-        "demo": "Demo",
-        "presentation": "Presentation",
-        "interview": "Interview",
-        "training": "Training",
-        "workshop": "Workshop",
-        "brainstorm": "Brainstorm",
-        "sync": "Sync",
-        "check-in": "Check-in",
-        "check in": "Check-in",
-        "weekly": "Weekly",
-        "daily": "Daily",
-        "review": "Review",
-    }
-
-    # Project/product patterns
-    projects = {
-        "transcription": "Transcription",
-        "simulation": "Simulation",
-        "assessment": "Assessment",
-        "curriculum": "Curriculum",
-        "analytics": "Analytics",
-        "dashboard": "Dashboard",
-    }
-
-    # Technical topic patterns
-    topics = {
-        "kafka": "Kafka",
-        "deployment": "Deployment",
-        "infrastructure": "Infra",
-        "infra": "Infra",
-        "terraform": "Terraform",
-        "database": "Database",
-        "api ": "API",
-        "frontend": "Frontend",
-        "backend": "Backend",
-        "testing": "Testing",
-        "bug fix": "Bug Fix",
-        "hotfix": "Hotfix",
-        "hot fix": "Hotfix",
-        "security": "Security",
-        "performance": "Performance",
-        "architecture": "Architecture",
-        "design": "Design",
-        "sprint": "Sprint",
-        "release": "Release",
-        "incident": "Incident",
-        "outage": "Outage",
-        "rca": "RCA",
-        "postmortem": "Postmortem",
-        "migration": "Migration",
-    }
-
-    # Look for team names
-    teams = {
-        "devops": "DevOps",
-        "sre": "SRE",
-        "engineering": "Engineering",
-        "product": "Product",
-    }
+    if _KEYWORD_AUTOMATON is not None:
+        # One pass over the content finds every keyword at once
+        found = {pattern for _, pattern in _KEYWORD_AUTOMATON.iter(content.lower())}
+        matches = found.__contains__
+    else:
+        # The keywords are ASCII, so scan a one-byte-per-char lowercased copy
+        # rather than a str that may be two or four bytes per char
+        content_bytes = content.encode("utf-8", "ignore").lower()
+
+        def matches(pattern: str) -> bool:
+            return _KEYWORD_BYTES[pattern] in content_bytes
 
     summary_parts = []
 
     # Find team (prefer longer matches)
-    for pattern, name in sorted(teams.items(), key=lambda x: -len(x[0])):
-        if pattern in content_lower:
+    for pattern, name in TEAMS.items():
+        if matches(pattern):
             summary_parts.append(name)
             break
 
     # Find meeting type (prefer longer matches)
-    for pattern, name in sorted(meeting_types.items(), key=lambda x: -len(x[0])):
-        if pattern in content_lower:
+    for pattern, name in MEETING_TYPES.items():
+        if matches(pattern):
             summary_parts.append(name)
             break
 
     # If we have a meeting type but no team, look for projects
     if len(summary_parts) == 1:
-        for pattern, name in sorted(projects.items(), key=lambda x: -len(x[0])):
-            if pattern in content_lower:
+        for pattern, name in PROJECTS.items():
+            if matches(pattern):
                 summary_parts.insert(0, name)
                 break
 
     # If still not enough context, look for technical topics
     if len(summary_parts) < 2:
-        for pattern, name in sorted(topics.items(), key=lambda x: -len(x[0])):
-            if pattern in content_lower:
+        for pattern, name in TOPICS.items():
+            if matches(pattern):
                 if name not in summary_parts:
                     summary_parts.append(name)
                     if len(summary_parts) >= 2:
@@ -257,15 +360,11 @@ def extract_summary_from_content(content: str, max_length: int = 50) -> str | No
         return summary[:max_length]
 
     # Fallback: extract first meaningful sentence (skip common greetings)
-    greetings = [
-        "thank you", "hello", "hi everyone", "hey guys", "good morning",
-        "good afternoon", "hey everyone", "hi there", "welcome",
-    ]
-    sentences = re.split(r"[.!?]+", content)
+    sentences = _SENT_SPLIT_RE.split(content)
     for sentence in sentences:
         sentence = sentence.strip()
         # Skip very short sentences or common greetings
-        if len(sentence) > 30 and not any(g in sentence.lower() for g in greetings):
+        if len(sentence) > 30 and not _GREETINGS_RE.search(sentence):
             # Clean and truncate to meaningful words
             words = [w for w in sentence.split() if len(w) > 2][:5]
             if len(words) >= 3:
@@ -274,9 +373,53 @@ def extract_summary_from_content(content: str, max_length: int = 50) -> str | No
     return None
 
 
-def analyze_transcription(file_path: str) -> TranscriptionAnalysis:
-    """Analyze a single transcription file for issues."""
-    file_size = os.path.getsize(file_path)
+def find_repeated_phrase(
+    words: list[str], window_size: int = 5, min_count: int = 3
+) -> tuple[str, int] | None:
+    """
+    Find the first phrase of window_size words that occurs min_count times.
+
+    Words are mapped to integer ids once and each window is tracked with a
+    rolling polynomial hash, so sliding the window is O(1) instead of joining
+    a new phrase string. The phrase text is only built for the hit.
+
+    Longer windows need no pass of their own: any longer phrase repeated
+    min_count times starts with a window_size phrase repeated as often.
+    """
+    if len(words) < window_size * min_count:
+        return None
+
+    word_ids: dict[str, int] = {}
+    ids = [word_ids.setdefault(word, len(word_ids)) for word in words]
+
+    # Weight of the word leaving the window
+    lead = pow(_HASH_BASE, window_size - 1, _HASH_MOD)
+    h = 0
+    for word_id in ids[:window_size]:
+        h = (h * _HASH_BASE + word_id) % _HASH_MOD
+    counts = {h: 1}
+
+    for start in range(1, len(ids) - window_size + 1):
+        h = ((h - ids[start - 1] * lead) * _HASH_BASE + ids[start + window_size - 1]) % _HASH_MOD
+        # One get and one store; Counter would route every new window
+        # through its Python-level __missing__
+        count = counts[h] = counts.get(h, 0) + 1
+        if count >= min_count:
+            return " ".join(words[start : start + window_size]), count
+
+    return None
+
+
+def analyze_transcription(
+    file_path: str, file_stat: os.stat_result | None = None, compute_summary: bool = True
+) -> TranscriptionAnalysis:
+    """Analyze a single transcription file for issues.
+
+    Pass file_stat when the caller already has it (e.g. from scandir). With
+    compute_summary=False the summary extraction is skipped and
+    suggested_summary is None.
+    """
+    file_size = (file_stat or os.stat(file_path)).st_size
     file_name = os.path.basename(file_path)
 
     metadata = parse_transcription_metadata(file_path)
@@ -286,7 +429,9 @@ def analyze_transcription(file_path: str) -> TranscriptionAnalysis:
 
     source_path, source_size = find_source_file(file_name)
 
-    word_count = len(content.split()) if content else 0
+    # Tokenize once; the truncation and repetition checks reuse it
+    words = content.split() if content else []
+    word_count = len(words)
     content_length = len(content)
 
     suspicion_reasons = []
@@ -313,30 +458,20 @@ def analyze_transcription(file_path: str) -> TranscriptionAnalysis:
     # Check for truncation indicators
     if content and not content.rstrip().endswith((".", "!", "?", '"', "'")):
         # Might be truncated mid-sentence
-        last_words = content.split()[-3:] if content.split() else []
-        if last_words and len(last_words[-1]) < 3:
+        if words and len(words[-1]) < 3:
             suspicion_reasons.append("Content may be truncated (ends mid-word)")
 
     # Check for repetition artifacts (sign of processing incomplete file)
-    if content:
+    if words:
         # Look for repeated phrases (5+ word sequences repeated 3+ times)
-        words = content.split()
-        for window_size in [5, 7, 10]:
-            if len(words) >= window_size * 3:
-                phrases = {}
-                for i in range(len(words) - window_size + 1):
-                    phrase = " ".join(words[i : i + window_size])
-                    phrases[phrase] = phrases.get(phrase, 0) + 1
-                for phrase, count in phrases.items():
-                    if count >= 3:
-                        suspicion_reasons.append(
-                            f"Repetition detected: '{phrase[:40]}...' appears {count}x"
-                        )
-                        break
-                if suspicion_reasons and "Repetition" in suspicion_reasons[-1]:
-                    break
+        repetition = find_repeated_phrase(words)
+        if repetition:
+            phrase, count = repetition
+            suspicion_reasons.append(
+                f"Repetition detected: '{phrase[:40]}...' appears {count}+ times"
+            )
 
-    suggested_summary = extract_summary_from_content(content)
+    suggested_summary = extract_summary_from_content(content) if compute_summary else None
 
     return TranscriptionAnalysis(
         file_path=file_path,
@@ -352,23 +487,51 @@ def analyze_transcription(file_path: str) -> TranscriptionAnalysis:
     )
 
 
-def analyze_all_transcriptions() -> list[TranscriptionAnalysis]:
-    """Analyze all transcription files in the output folder."""
+def _analyze_transcription_safe(
+    item: tuple[str, os.stat_result], compute_summary: bool = True
+) -> TranscriptionAnalysis | None:
+    """Run analyze_transcription, logging and skipping files that fail."""
+    file_path, file_stat = item
+    try:
+        return analyze_transcription(file_path, file_stat, compute_summary)
+    except Exception as e:
+        logger.error(f"Error analyzing {file_path}: {e}")
+        return None
+
+
+def analyze_all_transcriptions(
+    jobs: int = 1, compute_summary: bool = True
+) -> list[TranscriptionAnalysis]:
+    """
+    Analyze all transcription files in the output folder.
+
+    Files are independent, so with jobs > 1 they are analyzed across that many
+    worker processes. Pass compute_summary=False when suggested summaries
+    won't be used.
+    """
     results = []
 
     if not os.path.exists(config.output_folder):
         logger.warning(f"Output folder does not exist: {config.output_folder}")
         return results
 
-    for file_name in os.listdir(config.output_folder):
-        if file_name.endswith(".txt") and not file_name.endswith("_error.txt"):
-            file_path = os.path.join(config.output_folder, file_name)
-            try:
-                analysis = analyze_transcription(file_path)
-                results.append(analysis)
-            except Exception as e:
-                logger.error(f"Error analyzing {file_path}: {e}")
-
+    items = []
+    with os.scandir(config.output_folder) as entries:
+        for entry in entries:
+            if entry.name.endswith(".txt") and not entry.name.endswith("_error.txt"):
+                try:
+                    items.append((entry.path, entry.stat()))
+                except OSError as e:
+                    logger.error(f"Error analyzing {entry.path}: {e}")
+
+    analyze = partial(_analyze_transcription_safe, compute_summary=compute_summary)
+    if jobs > 1 and len(items) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            analyses = list(executor.map(analyze, items, chunksize=32))
+    else:
+        analyses = [analyze(item) for item in items]
+
+    results.extend(a for a in analyses if a is not None)
     return results
 
 
@@ -376,18 +539,23 @@ def find_original_video(audio_name: str) -> tuple[str | None, int | None, float
     """Find the original video file for a converted audio file."""
     base_name = os.path.splitext(audio_name)[0]
 
-    for ext in config.supported_video_formats:
-        video_path = os.path.join(config.video_folder, base_name + ext)
-        if os.path.exists(video_path):
-            return video_path, os.path.getsize(video_path), os.path.getmtime(video_path)
+    match = _media_lookup(config.video_folder, config.supported_video_formats, base_name)
+    if match:
+        return match
 
     return None, None, None
 
 
-def analyze_converted_audio(file_path: str) -> ConvertedAudioAnalysis:
-    """Analyze a converted audio file in the work folder."""
-    file_size = os.path.getsize(file_path)
-    file_mtime = os.path.getmtime(file_path)
+def analyze_converted_audio(
+    file_path: str, file_stat: os.stat_result | None = None
+) -> ConvertedAudioAnalysis:
+    """Analyze a converted audio file in the work folder.
+
+    Pass file_stat when the caller already has it (e.g. from scandir).
+    """
+    file_stat = file_stat or os.stat(file_path)
+    file_size = file_stat.st_size
+    file_mtime = file_stat.st_mtime
     file_name = os.path.basename(file_path)
     base_name = os.path.splitext(file_name)[0]
 
@@ -444,47 +612,54 @@ def analyze_work_folder() -> list[ConvertedAudioAnalysis]:
         logger.warning(f"Work folder does not exist: {config.work_folder}")
         return results
 
-    for file_name in os.listdir(config.work_folder):
-        if file_name.lower().endswith(config.supported_audio_formats):
-            file_path = os.path.join(config.work_folder, file_name)
-            try:
-                analysis = analyze_converted_audio(file_path)
-                results.append(analysis)
-            except Exception as e:
-                logger.error(f"Error analyzing {file_path}: {e}")
+    audio_exts = frozenset(config.supported_audio_formats)
+    with os.scandir(config.work_folder) as entries:
+        for entry in entries:
+            if os.path.splitext(entry.name)[1].lower() in audio_exts:
+                try:
+                    analysis = analyze_converted_audio(entry.path, entry.stat())
+                    results.append(analysis)
+                except Exception as e:
+                    logger.error(f"Error analyzing {entry.path}: {e}")
 
     return results
 
 
 def print_work_folder_report(analyses: list[ConvertedAudioAnalysis]) -> None:
     """Print analysis report for work folder."""
-    print("\n" + "=" * 80)
-    print("WORK FOLDER (CONVERTED AUDIO) ANALYSIS")
-    print("=" * 80)
+    # Collect the report and write it once instead of one print per line
+    lines: list[str] = []
+    emit = lines.append
+
+    emit("\n" + "=" * 80)
+    emit("WORK FOLDER (CONVERTED AUDIO) ANALYSIS")
+    emit("=" * 80)
 
     suspicious = [a for a in analyses if a.is_suspicious]
     clean = [a for a in analyses if not a.is_suspicious]
 
-    print(f"\nTotal converted audio files: {len(analyses)}")
-    print(f"Suspicious: {len(suspicious)}")
-    print(f"Clean: {len(clean)}")
+    emit(f"\nTotal converted audio files: {len(analyses)}")
+    emit(f"Suspicious: {len(suspicious)}")
+    emit(f"Clean: {len(clean)}")
 
     if suspicious:
-        print("\n" + "-" * 40)
-        print("SUSPICIOUS CONVERTED AUDIO (may need reconversion)")
-        print("-" * 40)
+        emit("\n" + "-" * 40)
+        emit("SUSPICIOUS CONVERTED AUDIO (may need reconversion)")
+        emit("-" * 40)
 
         for analysis in suspicious:
-            print(f"\n  File: {os.path.basename(analysis.file_path)}")
-            print(f"  Size: {analysis.file_size:,} bytes")
+            emit(f"\n  File: {os.path.basename(analysis.file_path)}")
+            emit(f"  Size: {analysis.file_size:,} bytes")
             if analysis.original_video_size:
-                print(f"  Original video: {analysis.original_video_size:,} bytes")
-            print(f"  Has transcription: {'Yes' if analysis.has_transcription else 'No'}")
-            print(f"  Issues:")
+                emit(f"  Original video: {analysis.original_video_size:,} bytes")
+            emit(f"  Has transcription: {'Yes' if analysis.has_transcription else 'No'}")
+            emit(f"  Issues:")
             for reason in analysis.suspicion_reasons:
-                print(f"    - {reason}")
+                emit(f"    - {reason}")
 
-    print("\n" + "=" * 80)
+    emit("\n" + "=" * 80)
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def reconvert_suspicious_audio(
@@ -535,34 +710,38 @@ def reconvert_suspicious_audio(
 
 def print_analysis_report(analyses: list[TranscriptionAnalysis]) -> None:
     """Print a formatted analysis report."""
-    print("\n" + "=" * 80)
-    print("TRANSCRIPTION ANALYSIS REPORT")
-    print("=" * 80)
+    # Collect the report and write it once instead of one print per line
+    lines: list[str] = []
+    emit = lines.append
+
+    emit("\n" + "=" * 80)
+    emit("TRANSCRIPTION ANALYSIS REPORT")
+    emit("=" * 80)
 
     suspicious = [a for a in analyses if a.is_suspicious]
     clean = [a for a in analyses if not a.is_suspicious]
 
-    print(f"\nTotal files: {len(analyses)}")
-    print(f"Suspicious: {len(suspicious)}")
-    print(f"Clean: {len(clean)}")
+    emit(f"\nTotal files: {len(analyses)}")
+    emit(f"Suspicious: {len(suspicious)}")
+    emit(f"Clean: {len(clean)}")
 
     if suspicious:
-        print("\n" + "-" * 40)
-        print("SUSPICIOUS TRANSCRIPTIONS (may need reprocessing)")
-        print("-" * 40)
+        emit("\n" + "-" * 40)
+        emit("SUSPICIOUS TRANSCRIPTIONS (may need reprocessing)")
+        emit("-" * 40)
 
         for analysis in suspicious:
-            print(f"\n  File: {os.path.basename(analysis.file_path)}")
-            print(f"  Size: {analysis.file_size} bytes, Words: {analysis.word_count}")
+            emit(f"\n  File: {os.path.basename(analysis.file_path)}")
+            emit(f"  Size: {analysis.file_size} bytes, Words: {analysis.word_count}")
             if analysis.source_size:
-                print(f"  Source: {analysis.source_size:,} bytes")
-            print(f"  Issues:")
+                emit(f"  Source: {analysis.source_size:,} bytes")
+            emit(f"  Issues:")
             for reason in analysis.suspicion_reasons:
-                print(f"    - {reason}")
+                emit(f"    - {reason}")
 
-    print("\n" + "-" * 40)
-    print("SUMMARY SUGGESTIONS")
-    print("-" * 40)
+    emit("\n" + "-" * 40)
+    emit("SUMMARY SUGGESTIONS")
+    emit("-" * 40)
 
     for analysis in analyses:
         file_name = os.path.basename(analysis.file_path)
@@ -574,10 +753,12 @@ def print_analysis_report(analyses: list[TranscriptionAnalysis]) -> None:
             continue  # Already has a suffix
 
         if analysis.suggested_summary:
-            print(f"\n  {file_name}")
-            print(f"    Suggested: {base} - {analysis.suggested_summary}.txt")
+            emit(f"\n  {file_name}")
+            emit(f"    Suggested: {base} - {analysis.suggested_summary}.txt")
+
+    emit("\n" + "=" * 80)
 
-    print("\n" + "=" * 80)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def reprocess_suspicious(analyses: list[TranscriptionAnalysis], dry_run: bool = True) -> None:
@@ -630,7 +811,7 @@ def rename_with_summaries(analyses: list[TranscriptionAnalysis], dry_run: bool =
             continue
 
         # Create new filename with summary
-        safe_summary = re.sub(r'[<>:"/\\|?*]', "", analysis.suggested_summary)  # Remove invalid chars
+        safe_summary = _INVALID_FN_RE.sub("", analysis.suggested_summary)  # Remove invalid chars
         safe_summary = safe_summary[:50]  # Limit length
         new_name = f"{base_name} - {safe_summary}.txt"
         new_path = os.path.join(os.path.dirname(analysis.file_path), new_name)
@@ -678,6 +859,13 @@ def main():
         help="Only reprocess files with repetition artifacts (skip 'duration unknown' only files)",
     )
 
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for transcription analysis (default: CPU count)",
+    )
+
     args = parser.parse_args()
     dry_run = not args.execute
 
@@ -685,8 +873,14 @@ def main():
         print("\n*** DRY RUN MODE - No changes will be made ***")
         print("*** Use --execute to apply changes ***\n")
 
-    # Always analyze transcriptions first
-    transcription_analyses = analyze_all_transcriptions()
+    # Always analyze transcriptions first; the reports and renames reuse the
+    # unfiltered list rather than re-reading every transcription. Summaries
+    # are only extracted for the actions that show or apply them.
+    all_transcription_analyses = analyze_all_transcriptions(
+        jobs=args.jobs,
+        compute_summary=args.action in ("analyze", "rename", "all"),
+    )
+    transcription_analyses = all_transcription_analyses
 
     # Also analyze work folder
     work_folder_analyses = analyze_work_folder()
@@ -694,12 +888,12 @@ def main():
     # Filter if --repetition-only is set
     if args.repetition_only:
         transcription_analyses = [
-            a for a in transcription_analyses
+            a for a in all_transcription_analyses
             if any("Repetition" in r for r in a.suspicion_reasons)
         ]
 
     if args.action == "analyze" or args.action == "all":
-        print_analysis_report(analyze_all_transcriptions())  # Show full report
+        print_analysis_report(all_transcription_analyses)  # Show full report
         print_work_folder_report(work_folder_analyses)
 
     if args.action == "reprocess" or args.action == "all":
@@ -708,8 +902,16 @@ def main():
     if args.action == "reconvert" or args.action == "all":
         reconvert_suspicious_audio(work_folder_analyses, dry_run=dry_run)
 
+    if args.action == "all" and not dry_run:
+        # reprocess/reconvert may have removed transcriptions and audio: drop
+        # analyses of deleted files and the now-stale media listings
+        _media_index.cache_clear()
+        all_transcription_analyses = [
+            a for a in all_transcription_analyses if os.path.exists(a.file_path)
+        ]
+
     if args.action == "rename" or args.action == "all":
-        rename_with_summaries(analyze_all_transcriptions(), dry_run=dry_run)
+        rename_with_summaries(all_transcription_analyses, dry_run=dry_run)
 
 
 if __name__ == "__main__":
@@ -5,16 +5,32 @@ Provides embedding extraction, storage, and matching against enrolled speaker pr
 Uses pyannote speaker embeddings via the WhisperX DiarizationPipeline.
 """
 
+import hashlib
 import json
 import logging
 import os
+import time
+import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Optional
 
 import numpy as np
 
+try:
+    import orjson  # Optional: faster profile (de)serialization
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# DiarizationPipeline instances keyed by (sha256 of HF token, device)
+_diarize_pipelines: dict[tuple[str, str], object] = {}
+_torch_load_patched = False
+
+# Reads of a profiles file that raced a save_profiles before giving up
+_LOAD_ATTEMPTS = 5
+
 
 @dataclass
 class SpeakerProfile:
@@ -26,6 +42,14 @@ class SpeakerProfile:
     sample_count: int = 0
     created_at: str = ""
     updated_at: str = ""
+    # float32 copy of centroid for matching; refreshed whenever it changes
+    _centroid_np: Optional[np.ndarray] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Running sum of embeddings so add_embedding is O(D); built on first use
+    _embedding_sum: Optional[np.ndarray] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         now = datetime.now().isoformat()
@@ -36,75 +60,156 @@ class SpeakerProfile:
         self.sample_count = len(self.embeddings)
         if self.embeddings and not self.centroid:
             self.centroid = compute_centroid(self.embeddings)
+        self._refresh_centroid_np()
 
     def add_embedding(self, embedding: list[float]):
         """Add a new embedding sample and recompute the centroid."""
+        vector = np.asarray(embedding, dtype=np.float64)
+        if self._embedding_sum is None:
+            existing = np.asarray(self.embeddings, dtype=np.float64).reshape(-1, vector.size)
+            self._embedding_sum = existing.sum(axis=0)
+        self._embedding_sum += vector
         self.embeddings.append(embedding)
         self.sample_count = len(self.embeddings)
-        self.centroid = compute_centroid(self.embeddings)
+        # Normalizing the sum gives the same direction as normalizing the mean.
+        # Fill both centroid forms from the one array rather than round-tripping
+        # the list back through np.asarray.
+        direction = self._embedding_sum / (np.linalg.norm(self._embedding_sum) or 1.0)
+        self.centroid = direction.tolist()
+        self._centroid_np = direction.astype(np.float32)
         self.updated_at = datetime.now().isoformat()
 
+    def _refresh_centroid_np(self):
+        self._centroid_np = np.asarray(self.centroid, dtype=np.float32) if self.centroid else None
+
 
 def compute_centroid(embeddings: list[list[float]]) -> list[float]:
     """Average multiple embeddings into a single centroid vector."""
     arr = np.array(embeddings)
-    centroid = arr.mean(axis=0)
+    return _l2_normalize(arr.mean(axis=0))
+
+
+def _l2_normalize(vector: np.ndarray) -> list[float]:
     # L2-normalize the centroid for consistent cosine similarity
-    norm = np.linalg.norm(centroid)
+    norm = np.linalg.norm(vector)
     if norm > 0:
-        centroid = centroid / norm
-    return centroid.tolist()
+        vector = vector / norm
+    return vector.tolist()
 
 
-def cosine_similarity(a: list[float], b: list[float]) -> float:
-    """Compute cosine similarity between two vectors."""
-    a_arr = np.array(a)
-    b_arr = np.array(b)
-    dot = np.dot(a_arr, b_arr)
-    norm_a = np.linalg.norm(a_arr)
-    norm_b = np.linalg.norm(b_arr)
-    if norm_a == 0 or norm_b == 0:
-        return 0.0
-    return float(dot / (norm_a * norm_b))
+def embeddings_path(path: str) -> str:
+    """Path of the .npz sidecar that holds the embeddings for a profiles file."""
+    return os.path.splitext(path)[0] + ".npz"
 
 
 def load_profiles(path: str) -> dict[str, SpeakerProfile]:
-    """Load speaker profiles from a JSON file."""
+    """
+    Load speaker profiles from a JSON file.
+
+    Embeddings and centroids are read from the .npz sidecar written by
+    save_profiles. Older files that inline them in the JSON still load.
+    The sidecar keys are unique to each save, so a JSON and sidecar from
+    different saves (a load racing save_profiles) never pair up; the read
+    is retried until both come from the same save.
+    """
     if not os.path.exists(path):
         return {}
 
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    for attempt in range(_LOAD_ATTEMPTS):
+        data, arrays = _read_profile_files(path)
+        if all(
+            f"{info['arrays']}_embeddings" in arrays
+            for info in data.values() if "arrays" in info
+        ):
+            break
+        time.sleep(0.05 * (attempt + 1))
+    else:
+        raise ValueError(
+            f"Speaker profiles {path} do not match their embeddings sidecar "
+            f"{embeddings_path(path)}"
+        )
 
     profiles = {}
     for name, info in data.items():
+        if "arrays" in info:
+            key = info["arrays"]
+            embeddings = arrays[f"{key}_embeddings"].tolist()
+            centroid = arrays[f"{key}_centroid"].tolist()
+        else:
+            embeddings = info["embeddings"]
+            centroid = info.get("centroid", [])
         profiles[name] = SpeakerProfile(
             name=info["name"],
-            embeddings=info["embeddings"],
-            centroid=info.get("centroid", []),
-            sample_count=info.get("sample_count", len(info["embeddings"])),
+            embeddings=embeddings,
+            centroid=centroid,
+            sample_count=info.get("sample_count", len(embeddings)),
             created_at=info.get("created_at", ""),
             updated_at=info.get("updated_at", ""),
         )
     return profiles
 
 
+def _read_profile_files(path: str) -> tuple[dict, dict[str, np.ndarray]]:
+    """Read a profiles JSON and, if it references one, its .npz sidecar."""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+    arrays = {}
+    if any("arrays" in info for info in data.values()):
+        with np.load(embeddings_path(path)) as npz:
+            arrays = {key: npz[key] for key in npz.files}
+    return data, arrays
+
+
 def save_profiles(profiles: dict[str, SpeakerProfile], path: str):
-    """Save speaker profiles to a JSON file."""
+    """
+    Save speaker profiles to a JSON file.
+
+    The JSON holds only names and timestamps; embeddings (float16) and
+    centroids (float32) go to a .npz sidecar (see embeddings_path), which
+    loads without parsing thousands of decimal floats. Sidecar keys carry
+    a per-save generation so load_profiles can tell mismatched files apart.
+    """
+    generation = uuid.uuid4().hex[:12]
     data = {}
-    for name, profile in profiles.items():
+    arrays = {}
+    for index, (name, profile) in enumerate(profiles.items()):
+        key = f"{generation}_p{index}"
+        # Samples are unit-length, so float16 keeps them to ~1e-4 (shifting
+        # match scores by ~1e-5) at half the size; the centroid used for
+        # matching stays float32
+        arrays[f"{key}_embeddings"] = np.asarray(profile.embeddings, dtype=np.float16)
+        arrays[f"{key}_centroid"] = np.asarray(profile.centroid, dtype=np.float32)
         data[name] = {
             "name": profile.name,
-            "embeddings": profile.embeddings,
-            "centroid": profile.centroid,
+            "arrays": key,
             "sample_count": profile.sample_count,
             "created_at": profile.created_at,
             "updated_at": profile.updated_at,
         }
 
     os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+
+    # Sidecar first, each file swapped in atomically, so the JSON never
+    # references arrays that haven't been written yet
+    npz_path = embeddings_path(path)
+    npz_tmp = npz_path + ".tmp"
+    with open(npz_tmp, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(npz_tmp, npz_path)
+
+    tmp_path = path + ".tmp"
+    if orjson is not None:
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
 
     logger.info(f"Saved {len(profiles)} speaker profile(s) to {path}")
 
@@ -131,92 +236,130 @@ def match_speakers(
     if not speaker_embeddings or not profiles:
         return {}
 
-    # Build similarity matrix: (speaker_label, profile_name, similarity)
-    scores = []
-    for speaker_label, embedding in speaker_embeddings.items():
-        emb = embedding if isinstance(embedding, list) else embedding.tolist()
-        for profile_name, profile in profiles.items():
-            if not profile.centroid:
-                continue
-            sim = cosine_similarity(emb, profile.centroid)
-            scores.append((speaker_label, profile_name, sim))
+    labels = list(speaker_embeddings)
+    names = [name for name, profile in profiles.items() if profile._centroid_np is not None]
+    if not names:
+        return {}
 
-    # Sort by similarity descending for greedy matching
-    scores.sort(key=lambda x: x[2], reverse=True)
+    # L2-normalize the speaker embeddings once; centroids are already
+    # normalized by compute_centroid, so cosine similarity is a plain dot
+    # product and the full (speakers x profiles) matrix is one matmul
+    first = np.asarray(speaker_embeddings[labels[0]])
+    embeddings = np.empty((len(labels), first.size), dtype=np.float32)
+    for i, label in enumerate(labels):
+        # Converts lists or float64 arrays straight into the float32 matrix
+        embeddings[i] = speaker_embeddings[label]
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    np.divide(embeddings, norms, out=embeddings, where=norms > 0)
+    centroids = np.stack([profiles[name]._centroid_np for name in names])
+    similarities = embeddings @ centroids.T
 
     matched_speakers: dict[str, str] = {}
     used_profiles: set[str] = set()
 
-    for speaker_label, profile_name, sim in scores:
+    # Greedy matching over the pairs that clear the threshold only, visited by
+    # similarity descending (stable, so ties keep speaker-major order)
+    flat = similarities.ravel()
+    candidates = np.flatnonzero(flat >= threshold)
+    candidates = candidates[np.argsort(-flat[candidates], kind="stable")]
+    max_matches = min(len(labels), len(names))
+    for flat_index in candidates:
+        i, j = divmod(int(flat_index), len(names))
+        sim = float(flat[flat_index])
+
+        speaker_label, profile_name = labels[i], names[j]
         if speaker_label in matched_speakers:
             continue
         if profile_name in used_profiles:
             continue
-        if sim < threshold:
-            continue
 
         matched_speakers[speaker_label] = profile_name
         used_profiles.add(profile_name)
         logger.info(
             f"Matched {speaker_label} → {profile_name} (similarity: {sim:.3f})"
         )
+        if len(matched_speakers) == max_matches:
+            break  # Every speaker or every profile is taken
 
     return matched_speakers
 
 
-def extract_embedding_from_audio(
-    audio_path: str, hf_token: str, device: str = "cpu"
-) -> list[float]:
+def _patch_torch_load():
     """
-    Extract a speaker embedding from an audio file.
+    Make torch.load default to weights_only=False, once per process.
 
-    Runs the DiarizationPipeline with num_speakers=1 and return_embeddings=True
-    to get a single speaker embedding.
+    PyTorch 2.6+ defaults to weights_only=True, but pyannote checkpoints
+    contain omegaconf/typing objects that aren't allowlisted. Same patch as
+    whisperx_pipeline applies at import; torch is imported lazily here so that
+    loading profiles doesn't pull it in.
     """
+    global _torch_load_patched
+    if _torch_load_patched:
+        return
+
     import functools
     import torch
 
-    # Ensure the torch.load patch is active for pyannote compatibility
-    _original_torch_load = torch.load
+    original_torch_load = torch.load
 
-    @functools.wraps(_original_torch_load)
+    @functools.wraps(original_torch_load)
     def _patched_torch_load(*args, **kwargs):
         kwargs["weights_only"] = False
-        return _original_torch_load(*args, **kwargs)
+        return original_torch_load(*args, **kwargs)
 
     torch.load = _patched_torch_load
+    _torch_load_patched = True
 
-    try:
+
+def _get_diarization_pipeline(hf_token: str, device: str):
+    """Return the cached DiarizationPipeline for (token, device), building it once."""
+    key = (hashlib.sha256(hf_token.encode()).hexdigest(), device)
+    pipeline = _diarize_pipelines.get(key)
+    if pipeline is None:
+        _patch_torch_load()
         from whisperx.diarize import DiarizationPipeline
 
         pipeline = DiarizationPipeline(
             use_auth_token=hf_token,
             device=device,
         )
+        _diarize_pipelines[key] = pipeline
+    return pipeline
 
-        diarize_result = pipeline(
-            audio_path,
-            num_speakers=1,
-            return_embeddings=True,
-        )
 
-        # When return_embeddings=True, result is a tuple: (segments_df, embeddings_dict)
-        if isinstance(diarize_result, tuple) and len(diarize_result) == 2:
-            _, embeddings = diarize_result
-            if embeddings:
-                # Get the first (and only, since num_speakers=1) embedding
-                for speaker_label, emb in embeddings.items():
-                    embedding = emb if isinstance(emb, list) else emb.tolist()
-                    # L2-normalize
-                    arr = np.array(embedding)
-                    norm = np.linalg.norm(arr)
-                    if norm > 0:
-                        arr = arr / norm
-                    return arr.tolist()
+def extract_embedding_from_audio(
+    audio_path: str, hf_token: str, device: str = "cpu"
+) -> list[float]:
+    """
+    Extract a speaker embedding from an audio file.
 
-        raise ValueError(
-            "DiarizationPipeline did not return embeddings. "
-            "Check that the audio contains speech."
-        )
-    finally:
-        torch.load = _original_torch_load
+    Runs the DiarizationPipeline with num_speakers=1 and return_embeddings=True
+    to get a single speaker embedding. The pipeline is cached per token and
+    device, so enrolling several samples loads the pyannote models once.
+    """
+    pipeline = _get_diarization_pipeline(hf_token, device)
+
+    diarize_result = pipeline(
+        audio_path,
+        num_speakers=1,
+        return_embeddings=True,
+    )
+
+    # When return_embeddings=True, result is a tuple: (segments_df, embeddings_dict)
+    if isinstance(diarize_result, tuple) and len(diarize_result) == 2:
+        _, embeddings = diarize_result
+        if embeddings:
+            # Get the first (and only, since num_speakers=1) embedding
+            for speaker_label, emb in embeddings.items():
+                embedding = emb if isinstance(emb, list) else emb.tolist()
+                # L2-normalize
+                arr = np.array(embedding)
+                norm = np.linalg.norm(arr)
+                if norm > 0:
+                    arr = arr / norm
+                return arr.tolist()
+
+    raise ValueError(
+        "DiarizationPipeline did not return embeddings. "
+        "Check that the audio contains speech."
+    )
@@ -16,16 +16,26 @@ from datetime import datetime
 from typing import Optional
 
 from celery import Task
+from celery.signals import task_prerun
 
 from celery_app import celery_app
 from config import config
 from database import get_db_session
 from models import TranscriptionJob, TranscriptionResult, ErrorLog
-from model_pool import acquire_model
+from model_pool import acquire_model, prefetch_model
+from repair_audio import remove_partial
 
 logger = logging.getLogger(__name__)
 
 
+def _is_nonempty_file(path: str) -> bool:
+    """Return True if path exists and has content, using a single stat()."""
+    try:
+        return os.stat(path).st_size > 0
+    except FileNotFoundError:
+        return False
+
+
 class TranscriptionTask(Task):
     """
     Base task class with custom error handling.
@@ -45,7 +55,10 @@ class TranscriptionTask(Task):
         """Called when task succeeds."""
         logger.info(
             f"Task {task_id} succeeded",
-            extra={'task_id': task_id, 'result': retval}
+            extra={
+                'task_id': task_id,
+                'result_status': retval.get('status') if isinstance(retval, dict) else None
+            }
         )
 
 
@@ -80,13 +93,13 @@ def transcribe_audio_task(self, file_path: str, model_size: str, language: Optio
     Raises:
         Retry: If transcription fails with recoverable error
     """
-    logger.info(f"Starting transcription task for job {job_id}")
+    logger.info("Starting transcription task for job %s", job_id)
 
     with get_db_session() as db:
         # Get job record
         job = db.query(TranscriptionJob).filter_by(id=job_id).first()
         if not job:
-            logger.error(f"Job {job_id} not found in database")
+            logger.error("Job %s not found in database", job_id)
             raise ValueError(f"Job {job_id} not found")
 
         try:
@@ -99,12 +112,12 @@ def transcribe_audio_task(self, file_path: str, model_size: str, language: Optio
             db.commit()
 
             # Acquire model from pool (with automatic loading if needed)
-            logger.info(f"Acquiring Whisper model from pool: {model_size}")
+            logger.info("Acquiring Whisper model from pool: %s", model_size)
             start_time = time.time()
 
             with acquire_model(model_size) as model:
                 acquire_time = time.time() - start_time
-                logger.info(f"Model acquired in {acquire_time:.2f}s")
+                logger.info("Model acquired in %.2fs", acquire_time)
 
                 # Update progress
                 job.current_step = "Transcribing audio"
@@ -112,7 +125,7 @@ def transcribe_audio_task(self, file_path: str, model_size: str, language: Optio
                 db.commit()
 
                 # Transcribe
-                logger.info(f"Transcribing file: {file_path}")
+                logger.info("Transcribing file: %s", file_path)
                 transcribe_start = time.time()
 
                 result = model.transcribe(
@@ -123,7 +136,7 @@ def transcribe_audio_task(self, file_path: str, model_size: str, language: Optio
                 )
 
                 transcribe_time = time.time() - transcribe_start
-                logger.info(f"Transcription completed in {transcribe_time:.2f}s")
+                logger.info("Transcription completed in %.2fs", transcribe_time)
             # Model automatically released back to pool here
 
             # Update progress
@@ -152,7 +165,7 @@ def transcribe_audio_task(self, file_path: str, model_size: str, language: Optio
                 # Write transcription text
                 f.write(result["text"])
 
-            logger.info(f"Transcription saved to: {output_file}")
+            logger.info("Transcription saved to: %s", output_file)
 
             # Save result to database
             transcription_result = TranscriptionResult(
@@ -172,7 +185,7 @@ def transcribe_audio_task(self, file_path: str, model_size: str, language: Optio
             job.current_step = "Done"
             db.commit()
 
-            logger.info(f"Job {job_id} completed successfully")
+            logger.info("Job %s completed successfully", job_id)
 
             return {
                 "status": "completed",
@@ -184,12 +197,12 @@ def transcribe_audio_task(self, file_path: str, model_size: str, language: Optio
 
         except RuntimeError as e:
             error_msg = str(e)
-            logger.error(f"RuntimeError during transcription: {error_msg}")
+            logger.error("RuntimeError during transcription: %s", error_msg)
 
             # Handle specific error types
             if "cannot reshape tensor" in error_msg or "0 elements" in error_msg:
                 # Corrupt audio file - attempt repair
-                logger.warning(f"Corrupt audio detected for job {job_id}, will attempt repair")
+                logger.warning("Corrupt audio detected for job %s, will attempt repair", job_id)
 
                 job.current_step = "Audio file appears corrupt, attempting repair"
                 job.retry_count += 1
@@ -227,7 +240,7 @@ def transcribe_audio_task(self, file_path: str, model_size: str, language: Optio
                     raise
 
         except MemoryError as e:
-            logger.error(f"MemoryError during transcription: {e}")
+            logger.error("MemoryError during transcription: %s", e)
 
             job.retry_count += 1
             db.commit()
@@ -238,7 +251,7 @@ def transcribe_audio_task(self, file_path: str, model_size: str, language: Optio
                 current_idx = size_hierarchy.index(model_size)
                 if current_idx > 0 and job.retry_count < job.max_retries:
                     smaller_size = size_hierarchy[current_idx - 1]
-                    logger.info(f"Falling back from {model_size} to {smaller_size}")
+                    logger.info("Falling back from %s to %s", model_size, smaller_size)
 
                     job.status = "retry"
                     job.error_message = f"OOM with {model_size}, retrying with {smaller_size}"
@@ -263,7 +276,7 @@ def transcribe_audio_task(self, file_path: str, model_size: str, language: Optio
             raise
 
         except Exception as e:
-            logger.error(f"Unexpected error during transcription: {e}", exc_info=True)
+            logger.error("Unexpected error during transcription: %s", e, exc_info=True)
 
             job.status = "failed"
             job.error_type = type(e).__name__
@@ -273,6 +286,37 @@ def transcribe_audio_task(self, file_path: str, model_size: str, language: Optio
             raise
 
 
+@task_prerun.connect(sender=transcribe_audio_task)
+def prefetch_next_job_model(sender=None, task_id=None, args=None, kwargs=None, **kw):
+    """
+    Signal handler that warms the model pool for the next pending job.
+
+    Runs just before a transcription starts, so the next job's model loads
+    in the background while this one transcribes.
+    """
+    try:
+        job_id = (kwargs or {}).get('job_id')
+        if job_id is None and args and len(args) > 3:
+            job_id = args[3]
+
+        with get_db_session() as db:
+            query = db.query(TranscriptionJob.model_size).filter(
+                TranscriptionJob.status == "pending"
+            )
+            if job_id:
+                query = query.filter(TranscriptionJob.id != job_id)
+            next_job = query.order_by(
+                TranscriptionJob.priority.desc(),
+                TranscriptionJob.created_at.asc()
+            ).first()
+
+        if next_job:
+            prefetch_model(next_job.model_size)
+    except Exception as e:
+        # Prefetching is an optimization - never fail the task over it
+        logger.warning(f"Could not prefetch model for next job: {e}")
+
+
 @celery_app.task(base=TranscriptionTask, bind=True, max_retries=3)
 def convert_video_task(self, input_path: str, job_id: str):
     """
@@ -300,7 +344,7 @@ def convert_video_task(self, input_path: str, job_id: str):
             output_path = os.path.join(config.work_folder, f"{base_name}.mp3")
 
             # Check if already converted
-            if os.path.exists(output_path):
+            if _is_nonempty_file(output_path):
                 logger.info(f"Converted file already exists: {output_path}")
                 return output_path
 
@@ -309,6 +353,8 @@ def convert_video_task(self, input_path: str, job_id: str):
                 [
                     "ffmpeg",
                     "-y",  # Overwrite output
+                    "-nostdin", "-nostats",
+                    "-loglevel", "error",  # Keep stderr to actual errors only
                     "-i", input_path,
                     "-acodec", "libmp3lame",
                     "-ar", "16000",  # Sample rate
@@ -317,12 +363,12 @@ def convert_video_task(self, input_path: str, job_id: str):
                     output_path
                 ],
                 check=True,
-                stdout=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
                 timeout=600  # 10 minute timeout
             )
 
-            if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+            if _is_nonempty_file(output_path):
                 logger.info(f"Video converted successfully: {output_path}")
                 return output_path
             else:
@@ -426,30 +472,38 @@ def repair_and_retry_task(self, job_id: str, file_path: str):
             base_name = os.path.splitext(os.path.basename(file_path))[0]
             repaired_file = os.path.join(config.work_folder, f"{base_name}_repaired.mp3")
 
-            if os.path.exists(repaired_file):
+            if _is_nonempty_file(repaired_file):
                 logger.info(f"Repaired file already exists: {repaired_file}")
             else:
                 # Repair with ffmpeg
                 logger.info(f"Repairing audio file: {file_path}")
 
-                subprocess.run(
-                    [
-                        "ffmpeg",
-                        "-y",
-                        "-i", file_path,
-                        "-acodec", "libmp3lame",
-                        "-ar", "16000",
-                        "-ac", "1",
-                        "-ab", "64k",
-                        repaired_file
-                    ],
-                    check=True,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    timeout=60
-                )
+                try:
+                    subprocess.run(
+                        [
+                            "ffmpeg",
+                            "-y",
+                            "-nostdin", "-nostats",
+                            "-loglevel", "error",
+                            "-i", file_path,
+                            "-acodec", "libmp3lame",
+                            "-ar", "16000",
+                            "-ac", "1",
+                            "-ab", "64k",
+                            repaired_file
+                        ],
+                        check=True,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.PIPE,
+                        timeout=60
+                    )
+                except BaseException:
+                    # A partial file would pass the "already exists" check
+                    # above on the next attempt and be transcribed truncated
+                    remove_partial(repaired_file)
+                    raise
 
-                if not os.path.exists(repaired_file) or os.path.getsize(repaired_file) == 0:
+                if not _is_nonempty_file(repaired_file):
                     raise RuntimeError("Repair produced empty file")
 
             logger.info(f"Audio repaired successfully: {repaired_file}")
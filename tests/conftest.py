@@ -2,69 +2,129 @@
 Pytest configuration and shared fixtures.
 """
 import os
+import struct
+
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from fastapi.testclient import TestClient
 
 from app import app
-from database import Base
-from models import TranscriptionJob, TranscriptionResult, ErrorLog
+from models import Base, TranscriptionJob, TranscriptionResult, ErrorLog
+
+# Minimal valid WAV header (44 bytes, 16 kHz mono 16-bit PCM, no samples)
+_WAV_HEADER = struct.pack(
+    "<4sI4s4sIHHIIHH4sI",
+    b"RIFF", 36, b"WAVE",  # RIFF chunk; size is file size - 8
+    b"fmt ", 16, 1, 1,  # Subchunk1Size, AudioFormat (PCM), NumChannels
+    16000, 32000, 2, 16,  # SampleRate, ByteRate, BlockAlign, BitsPerSample
+    b"data", 0,  # Subchunk2Size
+)
 
 
 @pytest.fixture(scope="session")
 def test_db_engine():
     """Create a test database engine."""
-    # Use in-memory SQLite for fast tests
-    engine = create_engine("sqlite:///:memory:", echo=False)
+    # Use in-memory SQLite for fast tests. A named shared-cache database on a
+    # single static connection lets every code path see the same data; the
+    # name is per xdist worker so parallel runs never share state
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    engine = create_engine(
+        f"sqlite:///file:testdb_{worker}?mode=memory&cache=shared&uri=true",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        echo=False,
+    )
+
+    # pysqlite defers BEGIN on its own, which breaks SAVEPOINT-based test
+    # isolation; let SQLAlchemy emit BEGIN itself
+    @event.listens_for(engine, "connect")
+    def disable_pysqlite_transactions(dbapi_conn, connection_record):
+        dbapi_conn.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    # Schema is built once per run; the in-memory database goes away with its
+    # last connection, so there is nothing to drop on teardown
     Base.metadata.create_all(engine)
     yield engine
-    Base.metadata.drop_all(engine)
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def test_session_factory():
+    """Session factory shared by all tests; sessions join the test's outer transaction."""
+    return sessionmaker(join_transaction_mode="create_savepoint")
 
 
 @pytest.fixture(scope="function")
-def db_session(test_db_engine):
-    """Create a new database session for each test."""
-    SessionLocal = sessionmaker(bind=test_db_engine)
-    session = SessionLocal()
+def db_session(test_db_engine, test_session_factory):
+    """
+    Create a database session isolated inside a rolled-back transaction.
+
+    Commits inside the test only release a SAVEPOINT, so rolling back the
+    outer transaction on teardown discards everything without touching schema.
+    """
+    connection = test_db_engine.connect()
+    transaction = connection.begin()
+    session = test_session_factory(bind=connection)
     yield session
-    session.rollback()
     session.close()
+    transaction.rollback()
+    connection.close()
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def client():
-    """FastAPI test client."""
+    """FastAPI test client, shared so app startup runs once per test run."""
     with TestClient(app) as c:
         yield c
 
 
-@pytest.fixture
-def sample_audio_file(tmp_path):
-    """Create a sample audio file for testing."""
-    audio_file = tmp_path / "test_audio.wav"
-    # Create a minimal valid WAV file (44 bytes header + silence)
-    with open(audio_file, "wb") as f:
-        # WAV header (44 bytes)
-        f.write(b'RIFF')
-        f.write((36).to_bytes(4, 'little'))  # File size - 8
-        f.write(b'WAVE')
-        f.write(b'fmt ')
-        f.write((16).to_bytes(4, 'little'))  # Subchunk1Size
-        f.write((1).to_bytes(2, 'little'))   # AudioFormat (PCM)
-        f.write((1).to_bytes(2, 'little'))   # NumChannels
-        f.write((16000).to_bytes(4, 'little'))  # SampleRate
-        f.write((32000).to_bytes(4, 'little'))  # ByteRate
-        f.write((2).to_bytes(2, 'little'))   # BlockAlign
-        f.write((16).to_bytes(2, 'little'))  # BitsPerSample
-        f.write(b'data')
-        f.write((0).to_bytes(4, 'little'))   # Subchunk2Size
+@pytest.fixture(scope="session")
+def sample_audio_bytes():
+    """Contents of a minimal WAV file, for uploading without touching disk."""
+    return _WAV_HEADER
+
+
+@pytest.fixture(scope="session")
+def sample_audio_file(tmp_path_factory):
+    """
+    Create a sample audio file for testing.
+
+    Shared by the whole session; tests that modify it should copy it first.
+    """
+    audio_file = tmp_path_factory.mktemp("audio") / "test_audio.wav"
+    audio_file.write_bytes(_WAV_HEADER)
     return audio_file
 
 
+class _FakeWhisperModel:
+    """Minimal stand-in for a loaded Whisper model."""
+
+    def transcribe(self, *args, **kwargs):
+        return {
+            "text": "This is a test transcription.",
+            "language": "en",
+            "duration": 10.5
+        }
+
+    def parameters(self):
+        return []
+
+
+@pytest.fixture
+def mock_whisper_model():
+    """Fake Whisper model for testing without loading actual models."""
+    return _FakeWhisperModel()
+
+
 @pytest.fixture
-def mock_whisper_model(mocker):
-    """Mock Whisper model for testing without loading actual models."""
+def mock_whisper_model_mocked(mocker):
+    """MagicMock Whisper model, for tests that configure or inspect calls."""
     mock_model = mocker.MagicMock()
     mock_model.transcribe.return_value = {
         "text": "This is a test transcription.",
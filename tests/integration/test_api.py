@@ -8,20 +8,32 @@ Tests the full API flow including:
 - Error handling
 - Admin endpoint authentication
 """
-import os
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import patch, Mock
+from unittest.mock import Mock
 import io
 
-# Set test API key for authenticated endpoints
+# Test API key for authenticated endpoints
 TEST_API_KEY = "test-api-key-12345"
-os.environ["API_KEYS"] = TEST_API_KEY
+
+
+@pytest.fixture(autouse=True)
+def api_keys(monkeypatch):
+    """Install the test API key without rebuilding the shared client."""
+    monkeypatch.setattr("auth.VALID_API_KEYS", {TEST_API_KEY})
 
 
 @pytest.mark.integration
 class TestTranscriptionAPI:
     """Test transcription API endpoints."""
+
+    @pytest.fixture(autouse=True)
+    def stub_celery_submit(self, monkeypatch):
+        """Keep job submission from reaching the Celery broker."""
+        monkeypatch.setattr(
+            "app.transcribe_audio_task.apply_async",
+            lambda *args, **kwargs: Mock(id="task-123")
+        )
     
     def test_health_check(self, client):
         """Test basic health check endpoint."""
@@ -31,18 +43,13 @@ class TestTranscriptionAPI:
         assert data["status"] == "healthy"
         assert "database" in data
     
-    @patch('app.transcribe_audio_task.apply_async')
-    def test_submit_transcription_job(self, mock_task, client, sample_audio_file):
+    def test_submit_transcription_job(self, client, sample_audio_bytes):
         """Test submitting a transcription job."""
-        # Mock Celery task
-        mock_task.return_value = Mock(id="task-123")
-        
-        with open(sample_audio_file, "rb") as f:
-            response = client.post(
-                "/transcribe/",
-                files={"file": ("test.wav", f, "audio/wav")},
-                data={"language": "en"}
-            )
+        response = client.post(
+            "/transcribe/",
+            files={"file": ("test.wav", io.BytesIO(sample_audio_bytes), "audio/wav")},
+            data={"language": "en"}
+        )
         
         assert response.status_code == 202  # Accepted
         data = response.json()
@@ -59,10 +66,11 @@ class TestTranscriptionAPI:
         )
         assert response.status_code == 400
     
-    def test_submit_file_too_large(self, client):
+    def test_submit_file_too_large(self, client, monkeypatch):
         """Test file size validation."""
-        # Create a file larger than max size
-        large_file = io.BytesIO(b"x" * (501 * 1024 * 1024))  # 501 MB
+        # Shrink the limit so the oversized upload stays small in memory
+        monkeypatch.setattr("app.config.max_upload_size_mb", 1)
+        large_file = io.BytesIO(b"x" * (1024 * 1024 + 1))  # 1 MB + 1 byte
         response = client.post(
             "/transcribe/",
             files={"file": ("huge.wav", large_file, "audio/wav")},
@@ -74,17 +82,13 @@ class TestTranscriptionAPI:
         response = client.get("/transcribe/550e8400-e29b-41d4-a716-446655440000")
         assert response.status_code == 404
     
-    @patch('app.transcribe_audio_task.apply_async')
-    def test_cancel_job(self, mock_task, client, sample_audio_file, db_session):
+    def test_cancel_job(self, client, sample_audio_bytes, db_session):
         """Test cancelling a pending job."""
-        mock_task.return_value = Mock(id="task-123")
-        
         # Submit job
-        with open(sample_audio_file, "rb") as f:
-            submit_response = client.post(
-                "/transcribe/",
-                files={"file": ("test.wav", f, "audio/wav")},
-            )
+        submit_response = client.post(
+            "/transcribe/",
+            files={"file": ("test.wav", io.BytesIO(sample_audio_bytes), "audio/wav")},
+        )
         job_id = submit_response.json()["job_id"]
         
         # Cancel job
@@ -145,24 +149,16 @@ class TestAPIErrorHandling:
         response = client.post("/transcribe/", data={"language": "en"})
         assert response.status_code == 422  # Unprocessable Entity
     
-    def test_invalid_model_size(self, client, sample_audio_file):
-        """Test invalid model size is rejected."""
-        with open(sample_audio_file, "rb") as f:
-            response = client.post(
-                "/transcribe/",
-                files={"file": ("test.wav", f, "audio/wav")},
-                data={"model_size": "invalid"}
-            )
-        # Should either reject or use default
-        assert response.status_code in [400, 422, 202]
-    
-    def test_invalid_language_code(self, client, sample_audio_file):
-        """Test invalid language code handling."""
-        with open(sample_audio_file, "rb") as f:
-            response = client.post(
-                "/transcribe/",
-                files={"file": ("test.wav", f, "audio/wav")},
-                data={"language": "xyz"}  # Invalid language
-            )
-        # Should either reject or use auto-detect
+    @pytest.mark.parametrize("field,value", [
+        ("model_size", "invalid"),
+        ("language", "xyz"),  # Invalid language
+    ])
+    def test_invalid_form_field(self, client, sample_audio_bytes, field, value):
+        """Test invalid model size / language code handling."""
+        response = client.post(
+            "/transcribe/",
+            files={"file": ("test.wav", io.BytesIO(sample_audio_bytes), "audio/wav")},
+            data={field: value}
+        )
+        # Should either reject or fall back to default / auto-detect
         assert response.status_code in [400, 422, 202]
@@ -47,7 +47,8 @@ class TestAuditHashChain:
         record_hash = hashlib.sha256(hash_input.encode()).hexdigest()
 
         assert len(record_hash) == 64
-        assert all(c in "0123456789abcdef" for c in record_hash)
+        assert record_hash == record_hash.lower()
+        assert len(bytes.fromhex(record_hash)) == 32  # Raises on non-hex
 
     def test_hash_chain_is_deterministic(self):
         """Test that same input produces same hash."""
@@ -68,6 +69,36 @@ class TestAuditHashChain:
 
         assert original_hash != tampered_hash
 
+    def test_build_record_links_to_previous_record(self):
+        """Test _build_record chains onto the latest row without touching the database."""
+        from audit import AuditLogger, _chain_hash
+
+        logger = AuditLogger(db_session_factory=Mock())
+        fields = dict(
+            action="job.create", resource_type="transcription_job",
+            resource_id="job-123", user_id="user-456", user_email=None,
+            user_role=None, agency_id=None, api_key_id=None, ip_address=None,
+            user_agent="x" * 600, request_id=None, session_id=None,
+            outcome="success", outcome_reason=None, previous_state=None,
+            new_state={"status": "pending"}, metadata=None,
+        )
+
+        genesis = logger._build_record(None, **fields)
+        assert genesis["sequence_number"] == 1
+        assert genesis["previous_hash"] == "0" * 64
+
+        prev = Mock(sequence_number=1, record_hash=genesis["record_hash"])
+        record = logger._build_record(prev, **fields)
+        assert record["sequence_number"] == 2
+        assert record["previous_hash"] == genesis["record_hash"]
+        assert record["record_hash"] == _chain_hash(
+            genesis["record_hash"],
+            (record["event_id"], record["event_timestamp"], "job.create",
+             "transcription_job", "job-123", "user-456", "success"),
+        )
+        assert len(record["user_agent"]) == 500
+        assert record["new_state"] == '{"status": "pending"}'
+
     def test_genesis_block_uses_zero_hash(self):
         """Test that first record in chain uses zero hash as previous."""
         genesis_previous_hash = "0" * 64
@@ -79,6 +110,13 @@ class TestAuditHashChain:
 class TestAuditLoggerUnit:
     """Unit tests for AuditLogger class."""
 
+    @pytest.fixture(autouse=True)
+    def _reset_audit_singleton(self, monkeypatch):
+        """Start each test without a cached AuditLogger; restored afterwards."""
+        import audit
+
+        monkeypatch.setattr(audit, "_audit_logger_instance", None)
+
     @patch('audit.SessionLocal')
     def test_audit_logger_initialization(self, mock_session_factory):
         """Test AuditLogger can be initialized."""
@@ -91,48 +129,57 @@ class TestAuditLoggerUnit:
     @patch('audit.SessionLocal')
     def test_get_audit_logger_returns_singleton(self, mock_session_factory):
         """Test get_audit_logger returns singleton instance."""
-        from audit import get_audit_logger, _audit_logger_instance
-        import audit
-
-        audit._audit_logger_instance = None
+        from audit import get_audit_logger
 
         logger1 = get_audit_logger()
         logger2 = get_audit_logger()
 
         assert logger1 is logger2
 
-    def test_audit_action_naming_convention(self):
+    @pytest.mark.parametrize("action", [
+        "job.create",
+        "job.read",
+        "job.update",
+        "job.delete",
+        "transcript.read",
+        "auth.login",
+        "auth.logout",
+        "auth.failed",
+    ])
+    def test_audit_action_naming_convention(self, action):
         """Test that audit actions follow naming convention."""
-        valid_actions = [
-            "job.create",
-            "job.read",
-            "job.update",
-            "job.delete",
-            "transcript.read",
-            "auth.login",
-            "auth.logout",
-            "auth.failed",
-        ]
+        parts = action.split(".")
+        assert len(parts) == 2, f"Action {action} should have format 'resource.verb'"
+        assert parts[0].isalpha(), f"Resource '{parts[0]}' should be alphabetic"
+        assert parts[1].isalpha(), f"Verb '{parts[1]}' should be alphabetic"
 
-        for action in valid_actions:
-            parts = action.split(".")
-            assert len(parts) == 2, f"Action {action} should have format 'resource.verb'"
-            assert parts[0].isalpha(), f"Resource '{parts[0]}' should be alphabetic"
-            assert parts[1].isalpha(), f"Verb '{parts[1]}' should be alphabetic"
-
-    def test_audit_outcome_values(self):
+    @pytest.mark.parametrize("outcome", ["success", "failure", "denied", "error"])
+    def test_audit_outcome_values(self, outcome):
         """Test valid outcome values."""
-        valid_outcomes = ["success", "failure", "denied", "error"]
-
-        for outcome in valid_outcomes:
-            assert outcome in ["success", "failure", "denied", "error"]
+        assert outcome in ["success", "failure", "denied", "error"]
 
 
 class TestChainIntegrityVerification:
     """Test chain integrity verification logic."""
 
+    def test_chain_hash_matches_documented_format(self):
+        """Test _chain_hash hashes the pipe-joined fields and previous hash."""
+        from audit import _chain_hash
+
+        timestamp = datetime(2025, 1, 15, 10, 30, 0)
+        fields = ("event-1", timestamp, "job.create", "transcription_job",
+                  "job-123", "user-456", "success")
+        hash_input = (
+            f"event-1|{timestamp.isoformat()}|job.create|transcription_job|"
+            f"job-123|user-456|success|" + "0" * 64
+        )
+
+        assert _chain_hash("0" * 64, fields) == hashlib.sha256(hash_input.encode()).hexdigest()
+
     def test_verify_chain_with_valid_records(self):
         """Test verification passes for valid chain."""
+        from audit import _chain_hash
+
         records = []
         prev_hash = "0" * 64
 
@@ -145,12 +192,10 @@ class TestChainIntegrityVerification:
             user_id = "user-1"
             outcome = "success"
 
-            hash_input = (
-                f"{event_id}|{timestamp.isoformat()}|"
-                f"{action}|{resource_type}|{resource_id}|"
-                f"{user_id}|{outcome}|{prev_hash}"
+            record_hash = _chain_hash(
+                prev_hash,
+                (event_id, timestamp, action, resource_type, resource_id, user_id, outcome),
             )
-            record_hash = hashlib.sha256(hash_input.encode()).hexdigest()
 
             records.append({
                 "sequence_number": i + 1,
@@ -3,15 +3,18 @@ Unit tests for model_pool.py
 
 Tests the thread-safe model pool implementation including:
 - Model acquisition and release
-- LRU eviction
+- Frequency-based eviction
 - OOM fallback
 - Statistics tracking
 - Concurrency safety
 """
-import pytest
+import queue
 import threading
-import time
-from unittest.mock import Mock, patch, MagicMock
+from datetime import timedelta
+
+import pytest
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
+from unittest.mock import ANY, Mock, patch, MagicMock
 from model_pool import ModelPool, ModelInstance, acquire_model
 
 
@@ -30,16 +33,16 @@ class TestModelInstance:
         assert instance.model_size == "small"
         assert instance.use_count == 0
     
-    def test_memory_calculation(self, mock_whisper_model):
+    def test_memory_calculation(self, mock_whisper_model_mocked):
         """Test memory footprint calculation."""
         # Mock model parameters
         mock_param = Mock()
         mock_param.element_size.return_value = 4  # 4 bytes per element
         mock_param.nelement.return_value = 1000000  # 1M elements
-        mock_whisper_model.parameters.return_value = [mock_param]
+        mock_whisper_model_mocked.parameters.return_value = [mock_param]
         
         instance = ModelInstance(
-            model=mock_whisper_model,
+            model=mock_whisper_model_mocked,
             model_size="tiny",
             loaded_at=None,
             last_used=None
@@ -50,6 +53,13 @@ class TestModelInstance:
 
 class TestModelPool:
     """Test ModelPool functionality."""
+
+    @pytest.fixture(autouse=True)
+    def _patch_whisper(self, mocker):
+        """Patch Whisper model loading once for every test in the class."""
+        self.mock_load = mocker.patch('model_pool.whisper.load_model')
+        self.mock_load.return_value = Mock()
+        yield
     
     def test_pool_initialization(self):
         """Test pool initializes with correct settings."""
@@ -58,10 +68,9 @@ class TestModelPool:
         assert pool.pool_size == 3
         assert pool.max_pool_size == 6
     
-    @patch('model_pool.whisper.load_model')
-    def test_acquire_new_model(self, mock_load_model, mock_whisper_model):
+    def test_acquire_new_model(self, mock_whisper_model):
         """Test acquiring a model when pool is empty."""
-        mock_load_model.return_value = mock_whisper_model
+        self.mock_load.return_value = mock_whisper_model
         pool = ModelPool(default_size="tiny", pool_size=2, max_pool_size=4)
         
         instance = pool.acquire(model_size="tiny", timeout=1)
@@ -69,12 +78,11 @@ class TestModelPool:
         assert instance is not None
         assert instance.model_size == "tiny"
         assert instance.use_count == 0
-        mock_load_model.assert_called_once_with("tiny")
+        self.mock_load.assert_called_once_with("tiny", device=ANY)
     
-    @patch('model_pool.whisper.load_model')
-    def test_acquire_reuses_released_model(self, mock_load_model, mock_whisper_model):
+    def test_acquire_reuses_released_model(self, mock_whisper_model):
         """Test that released models are reused from pool."""
-        mock_load_model.return_value = mock_whisper_model
+        self.mock_load.return_value = mock_whisper_model
         pool = ModelPool(default_size="tiny", pool_size=2, max_pool_size=4)
         
         # Acquire and release a model
@@ -87,14 +95,13 @@ class TestModelPool:
         # Should be the same instance
         assert instance2 is instance1
         # Load should only be called once
-        assert mock_load_model.call_count == 1
+        assert self.mock_load.call_count == 1
         # Use count should increment
         assert instance2.use_count == 1
     
-    @patch('model_pool.whisper.load_model')
-    def test_pool_statistics(self, mock_load_model, mock_whisper_model):
+    def test_pool_statistics(self, mock_whisper_model):
         """Test pool tracks hits and misses correctly."""
-        mock_load_model.return_value = mock_whisper_model
+        self.mock_load.return_value = mock_whisper_model
         pool = ModelPool(default_size="tiny", pool_size=2, max_pool_size=4)
         
         # First acquire - miss
@@ -113,10 +120,9 @@ class TestModelPool:
         
         pool.release(instance2)
     
-    @patch('model_pool.whisper.load_model')
-    def test_lru_eviction(self, mock_load_model, mock_whisper_model):
-        """Test that LRU eviction works when pool is full."""
-        mock_load_model.return_value = mock_whisper_model
+    def test_eviction_when_pool_full(self, mock_whisper_model):
+        """Test that a model is evicted when the pool is full."""
+        self.mock_load.return_value = mock_whisper_model
         pool = ModelPool(default_size="tiny", pool_size=1, max_pool_size=2)
         
         # Load 2 different models (fills pool to max)
@@ -133,18 +139,84 @@ class TestModelPool:
         stats = pool.get_stats()
         assert stats['evictions'] >= 1  # Should have evicted at least once
     
-    @patch('model_pool.whisper.load_model')
-    def test_oom_fallback(self, mock_load_model):
+    def test_eviction_skips_checked_out_model(self):
+        """Test eviction picks an idle model, never a freshly loaded one in use."""
+        self.mock_load.side_effect = lambda *args, **kwargs: Mock()
+        pool = ModelPool(default_size="tiny", pool_size=2, max_pool_size=2)
+
+        # Idle, frequently used "small"
+        small = pool.acquire(model_size="small", timeout=0)
+        pool.release(small)
+        for _ in range(5):
+            pool.release(pool.acquire(model_size="small", timeout=0))
+        assert small.use_count == 5
+
+        # Just loaded and checked out
+        large = pool.acquire(model_size="large", timeout=0)
+
+        # Pool is full: loading "tiny" must evict the idle "small"
+        tiny = pool.acquire(model_size="tiny", timeout=0)
+
+        assert pool.get_stats()['evictions'] == 1
+        assert hasattr(large, "model")
+        assert not hasattr(small, "model")
+
+        # The in-use model goes back to the pool intact and is reusable
+        pool.release(large)
+        assert pool.acquire(model_size="large", timeout=0) is large
+        pool.release(tiny)
+
+    def test_eviction_keeps_heavily_used_model(self):
+        """Test a heavily used model idle for a while outlives a recent, rarely used one."""
+        self.mock_load.side_effect = lambda *args, **kwargs: Mock()
+        pool = ModelPool(default_size="large", pool_size=1, max_pool_size=2)
+
+        large = pool.acquire(model_size="large", timeout=0)
+        pool.release(large)
+        for _ in range(100):
+            pool.release(pool.acquire(model_size="large", timeout=0))
+        # Idle for one heat half-life: ~101 uses decay to ~50, still well
+        # above the tiny model's ~3
+        large.last_used -= timedelta(minutes=10)
+
+        tiny = pool.acquire(model_size="tiny", timeout=0)
+        pool.release(tiny)
+        pool.release(pool.acquire(model_size="tiny", timeout=0))
+
+        pool.release(pool.acquire(model_size="small", timeout=0))
+
+        assert hasattr(large, "model")
+        assert not hasattr(tiny, "model")
+
+    def test_acquire_never_loads_past_max_pool_size(self):
+        """Test a miss with every model checked out waits instead of loading."""
+        self.mock_load.side_effect = lambda *args, **kwargs: Mock()
+        pool = ModelPool(default_size="tiny", pool_size=1, max_pool_size=1)
+
+        held = pool.acquire(model_size="tiny", timeout=0)
+
+        with pytest.raises(queue.Empty):
+            pool.acquire(model_size="base", timeout=0.05)
+        assert self.mock_load.call_count == 1
+        assert pool.get_stats()['total_loaded'] == 1
+
+        # Once the held model is idle it can be evicted to make room
+        pool.release(held)
+        base = pool.acquire(model_size="base", timeout=0)
+        assert base.model_size == "base"
+        assert pool.get_stats()['evictions'] == 1
+
+    def test_oom_fallback(self):
         """Test OOM fallback to smaller model."""
         # Simulate OOM for large model
-        def load_model_side_effect(size):
+        def load_model_side_effect(size, **kwargs):
             if size == "large":
                 raise RuntimeError("CUDA out of memory")
             else:
                 mock_model = Mock()
                 return mock_model
         
-        mock_load_model.side_effect = load_model_side_effect
+        self.mock_load.side_effect = load_model_side_effect
         pool = ModelPool(default_size="large", pool_size=1, max_pool_size=2)
         
         # Should fall back to medium
@@ -155,34 +227,80 @@ class TestModelPool:
         stats = pool.get_stats()
         assert stats['oom_fallbacks'] == 1
     
-    @patch('model_pool.whisper.load_model')
-    def test_concurrent_access(self, mock_load_model, mock_whisper_model):
-        """Test pool is thread-safe with concurrent access."""
-        mock_load_model.return_value = mock_whisper_model
+    def test_prefetch_loads_model_in_background(self):
+        """Test prefetched models are served as pool hits."""
+        self.mock_load.return_value = Mock()
+        pool = ModelPool(default_size="tiny", pool_size=1, max_pool_size=2)
+
+        pool.prefetch("tiny")
+        # Second prefetch is a no-op while the first is in flight or parked
+        pool.prefetch("tiny")
+
+        instance = pool.acquire(model_size="tiny", timeout=2)
+        assert instance.model_size == "tiny"
+        assert self.mock_load.call_count == 1
+
+        stats = pool.get_stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 0
+
+    def test_acquire_waits_for_in_flight_prefetch(self):
+        """Test a miss during a prefetch of the same size never loads a duplicate."""
+        gate = threading.Event()
+
+        def slow_load(*args, **kwargs):
+            gate.wait(2)
+            return Mock()
+
+        self.mock_load.side_effect = slow_load
+        pool = ModelPool(default_size="tiny", pool_size=1, max_pool_size=2)
+
+        pool.prefetch("tiny")
+        with pytest.raises(queue.Empty):
+            pool.acquire(model_size="tiny", timeout=0.05)
+        assert self.mock_load.call_count == 1
+
+        gate.set()
+        instance = pool.acquire(model_size="tiny", timeout=2)
+        assert instance.model_size == "tiny"
+        assert self.mock_load.call_count == 1
+        assert pool.get_stats()['misses'] == 0
+
+    def test_acquire_prefers_last_released_model(self):
+        """Test a thread gets back the model it released most recently."""
+        self.mock_load.side_effect = lambda *args, **kwargs: Mock()
         pool = ModelPool(default_size="tiny", pool_size=2, max_pool_size=4)
-        
-        results = []
-        errors = []
-        
-        def worker():
-            try:
-                instance = pool.acquire(model_size="tiny", timeout=2)
-                time.sleep(0.01)  # Simulate work
-                pool.release(instance)
-                results.append(True)
-            except Exception as e:
-                errors.append(e)
-        
-        # Start 10 threads trying to acquire models
-        threads = [threading.Thread(target=worker) for _ in range(10)]
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
-        
-        # All threads should succeed
-        assert len(results) == 10
-        assert len(errors) == 0
+
+        first = pool.acquire(model_size="tiny", timeout=0.1)
+        second = pool.acquire(model_size="tiny", timeout=0.1)
+        pool.release(first)
+        pool.release(second)
+
+        # FIFO order would hand back `first`
+        assert pool.acquire(model_size="tiny", timeout=0.1) is second
+
+    def test_acquire_blocks_until_model_released(self, mock_whisper_model):
+        """Test a second thread blocks until the held model is released."""
+        self.mock_load.return_value = mock_whisper_model
+        pool = ModelPool(default_size="tiny", pool_size=1, max_pool_size=1)
+
+        # timeout=0: miss immediately and load the only model
+        held = pool.acquire(model_size="tiny", timeout=0)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            contender = executor.submit(pool.acquire, "tiny", 2)
+
+            # Contender must be waiting on the pool, not loading its own copy
+            with pytest.raises(FuturesTimeout):
+                contender.result(timeout=0.05)
+
+            pool.release(held)
+            assert contender.result(timeout=2) is held
+
+        assert self.mock_load.call_count == 1
+        stats = pool.get_stats()
+        assert stats['misses'] == 1
+        assert stats['hits'] == 1
 
 
 @pytest.mark.integration
@@ -201,7 +319,7 @@ class TestAcquireModelContextManager:
             assert model == mock_instance.model
         
         # Should have acquired and released
-        mock_pool.acquire.assert_called_once_with("small")
+        mock_pool.acquire.assert_called_once_with("small", 300)
         mock_pool.release.assert_called_once_with(mock_instance)
     
     @patch('model_pool.get_model_pool')
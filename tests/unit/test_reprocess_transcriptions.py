@@ -0,0 +1,34 @@
+"""
+Unit tests for reprocess_transcriptions.py
+
+Tests the rolling-hash repetition detector used by analyze_transcription.
+"""
+from reprocess_transcriptions import find_repeated_phrase
+
+
+class TestFindRepeatedPhrase:
+    """Test find_repeated_phrase."""
+
+    def test_detects_repeated_five_word_phrase(self):
+        """Test a 5-word phrase repeated three times is reported."""
+        words = "we will circle back later".split() * 3
+
+        assert find_repeated_phrase(words) == ("we will circle back later", 3)
+
+    def test_short_input_returns_none(self):
+        """Test fewer than window_size * min_count words is never flagged."""
+        words = ("a b c d e".split() * 3)[:14]
+
+        assert find_repeated_phrase(words) is None
+
+    def test_longer_repeat_found_through_prefix(self):
+        """Test a repeated 7-word phrase is caught via its first five words."""
+        words = "thank you all for joining today everyone".split() * 3
+
+        assert find_repeated_phrase(words) == ("thank you all for joining", 3)
+
+    def test_no_repeat_returns_none(self):
+        """Test text without a repeated phrase is not flagged."""
+        words = [f"word{i}" for i in range(40)]
+
+        assert find_repeated_phrase(words) is None
@@ -0,0 +1,100 @@
+"""
+Unit tests for speaker_profiles.py
+
+Tests the on-disk profile format:
+- JSON metadata plus .npz embeddings sidecar round trip
+- Legacy JSON files with inline embeddings
+- Detection of a JSON and sidecar from different saves
+"""
+import json
+import shutil
+
+import numpy as np
+import pytest
+
+import speaker_profiles
+from speaker_profiles import (
+    SpeakerProfile,
+    embeddings_path,
+    load_profiles,
+    save_profiles,
+)
+
+
+class TestProfileStorage:
+    """Test save_profiles / load_profiles."""
+
+    def test_round_trip(self, tmp_path):
+        """Test profiles survive a save and load, with compact sidecar dtypes."""
+        path = str(tmp_path / "profiles.json")
+        alice = SpeakerProfile(name="Alice", embeddings=[[0.6, 0.8], [0.8, 0.6]])
+
+        save_profiles({"Alice": alice}, path)
+        loaded = load_profiles(path)
+
+        assert list(loaded) == ["Alice"]
+        profile = loaded["Alice"]
+        assert profile.sample_count == 2
+        assert profile.created_at == alice.created_at
+        assert profile.updated_at == alice.updated_at
+        np.testing.assert_allclose(profile.embeddings, alice.embeddings, atol=1e-3)
+        np.testing.assert_allclose(profile.centroid, alice.centroid, atol=1e-6)
+
+        with np.load(embeddings_path(path)) as npz:
+            dtypes = {key.rsplit("_", 1)[1]: npz[key].dtype for key in npz.files}
+        assert dtypes == {"embeddings": np.float16, "centroid": np.float32}
+
+    def test_load_legacy_inline_json(self, tmp_path):
+        """Test a JSON file with inline embeddings and no sidecar still loads."""
+        path = tmp_path / "profiles.json"
+        path.write_text(json.dumps({
+            "Bob": {
+                "name": "Bob",
+                "embeddings": [[1.0, 0.0], [0.0, 1.0]],
+                "centroid": [0.7071, 0.7071],
+                "sample_count": 2,
+                "created_at": "2025-01-15T10:30:00",
+                "updated_at": "2025-01-15T10:30:00",
+            }
+        }))
+
+        loaded = load_profiles(str(path))
+
+        assert loaded["Bob"].embeddings == [[1.0, 0.0], [0.0, 1.0]]
+        assert loaded["Bob"].centroid == [0.7071, 0.7071]
+        assert loaded["Bob"].created_at == "2025-01-15T10:30:00"
+
+    def test_mismatched_sidecar_raises_after_retries(self, tmp_path, monkeypatch):
+        """Test a JSON and sidecar from different saves are never paired."""
+        path = str(tmp_path / "profiles.json")
+        profiles = {
+            "Alice": SpeakerProfile(name="Alice", embeddings=[[1.0, 0.0]]),
+            "Bob": SpeakerProfile(name="Bob", embeddings=[[0.0, 1.0]]),
+        }
+        save_profiles(profiles, path)
+        shutil.copy(path, path + ".old")
+
+        # Removing Alice shifts Bob to index 0 in the new sidecar
+        del profiles["Alice"]
+        save_profiles(profiles, path)
+        shutil.copy(path + ".old", path)
+
+        reads = []
+        read_profile_files = speaker_profiles._read_profile_files
+        monkeypatch.setattr(
+            speaker_profiles, "_read_profile_files",
+            lambda p: reads.append(p) or read_profile_files(p),
+        )
+        monkeypatch.setattr(speaker_profiles.time, "sleep", lambda seconds: None)
+
+        with pytest.raises(ValueError):
+            load_profiles(path)
+        assert len(reads) == speaker_profiles._LOAD_ATTEMPTS
+
+    def test_save_empty_then_load(self, tmp_path):
+        """Test saving no profiles writes files that load back empty."""
+        path = str(tmp_path / "profiles.json")
+
+        save_profiles({}, path)
+
+        assert load_profiles(path) == {}
@@ -379,13 +379,13 @@ def process_file(file_path):
 
     # Check if file was created before the configured cutoff date
     try:
+        # Compare raw timestamps; a datetime is only built for the log line
         file_creation_time = os.path.getctime(file_path)
-        creation_date = datetime.fromtimestamp(file_creation_time)
 
-        if creation_date < config.cutoff_datetime:
+        if file_creation_time < config.cutoff_timestamp:
             logger.debug(
                 f"Skipping file created before {config.skip_files_before_date}: {file_path} "
-                f"(created: {creation_date.strftime('%Y-%m-%d')})"
+                f"(created: {datetime.fromtimestamp(file_creation_time).strftime('%Y-%m-%d')})"
             )
             return
     except Exception as e:
@@ -6,6 +6,7 @@ Alignment and diarization failures degrade gracefully — the transcription stil
 with segment-level timestamps only.
 """
 
+import gc
 import logging
 import re
 
@@ -35,34 +36,43 @@ from speaker_profiles import load_profiles, match_speakers
 logger = logging.getLogger(__name__)
 
 # Module-level model caches (loaded lazily, reused across calls)
-_whisperx_model = None
+# Only the most recently loaded transcription model is kept resident
+_whisperx_model_cache: dict[tuple, object] = {}  # (model_size, device, compute_type) → model
 _align_model_cache: dict[str, tuple] = {}  # language → (model, metadata)
 _diarize_pipeline = None
 
 
 def load_transcription_model():
-    """Load and cache the WhisperX transcription model."""
-    global _whisperx_model
-
-    if _whisperx_model is not None:
-        return _whisperx_model
-
+    """Load and cache the WhisperX transcription model for the current config."""
     device = config.whisperx_device
     compute_type = config.resolved_compute_type
+    key = (config.model_size, device, compute_type)
+
+    if key in _whisperx_model_cache:
+        return _whisperx_model_cache[key]
+
+    # A different size/device/compute type was requested: drop the old model
+    # before loading so two sets of weights are never resident at once
+    if _whisperx_model_cache:
+        _whisperx_model_cache.clear()
+        gc.collect()
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
 
     logger.info(
         f"Loading WhisperX model: {config.model_size} on {device} "
         f"(compute_type={compute_type}, batch_size={config.resolved_batch_size})"
     )
 
-    _whisperx_model = whisperx.load_model(
+    model = whisperx.load_model(
         config.model_size,
         device=device,
         compute_type=compute_type,
     )
+    _whisperx_model_cache[key] = model
 
     logger.info(f"Successfully loaded WhisperX model: {config.model_size} on {device}")
-    return _whisperx_model
+    return model
 
 
 def _load_align_model(language_code: str):